@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Source checks shared by verify_chain_of_custody.py and
+verify_chain_of_custody_v2.py. Both scripts import from here so the
+sandbox rule is defined once.
+"""
+
+from __future__ import annotations
+
+import ast
+
+
+def calls_restricted_exec(source: str) -> bool:
+    """
+    True when the parsed code (not comments or docstrings) calls
+    compile(..., "<sandbox>", "exec") and also calls exec().
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return False
+    compiles = execs = False
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        name = func.id if isinstance(func, ast.Name) else getattr(func, "attr", None)
+        if name == "exec":
+            execs = True
+        elif name == "compile":
+            consts = {a.value for a in node.args if isinstance(a, ast.Constant) and isinstance(a.value, str)}
+            compiles = compiles or {"<sandbox>", "exec"} <= consts
+    return compiles and execs
@@ -2,20 +2,27 @@
 # ArkEcho Systems © 2025 — deterministic, offline evidence-bundle stub.
 
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, List
 import json, hashlib, os
 from datetime import datetime, UTC
 
+class PackagingError(Exception):
+    """
+    Raised by package_batch when one or more events could not be written.
+    .manifests holds the manifests of the events that were written, in input order.
+    """
+    def __init__(self, manifests: List[Dict[str, Any]], errors: List[Exception], total: int):
+        super().__init__(f"{len(errors)} of {total} events failed: {errors[0]}")
+        self.manifests = manifests
+        self.errors = errors
+
 def _sha256_bytes(b: bytes) -> str:
     return hashlib.sha256(b).hexdigest()
 
-def package(event: Dict[str, Any], out_dir: str = "evidence") -> Dict[str, Any]:
-    """
-    Deterministically packages an evidence event with timestamps and checksums.
-    Offline-only; no network calls. Returns manifest including file paths.
-    """
-    os.makedirs(out_dir, exist_ok=True)
-    ts = datetime.now(UTC).isoformat(timespec="seconds").replace(":", "")
+def _stamp() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds").replace(":", "")
+
+def _write(event: Dict[str, Any], out_dir: str, ts: str) -> Dict[str, Any]:
     body = {
         "timestamp": ts,
         "event": event,
@@ -38,3 +45,32 @@ def package(event: Dict[str, Any], out_dir: str = "evidence") -> Dict[str, Any]:
     with open(path + ".manifest.json", "w", encoding="utf-8") as mf:
         mf.write(json.dumps(manifest, ensure_ascii=False, indent=2))
     return manifest
+
+def package(event: Dict[str, Any], out_dir: str = "evidence") -> Dict[str, Any]:
+    """
+    Deterministically packages an evidence event with timestamps and checksums.
+    Offline-only; no network calls. Returns manifest including file paths.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    return _write(event, out_dir, _stamp())
+
+def package_batch(events: List[Dict[str, Any]], out_dir: str = "evidence") -> List[Dict[str, Any]]:
+    """
+    Packages several events in one call (one directory check, one timestamp).
+    Returns one manifest per event, in input order. A failed event does not
+    stop the rest; if any failed, PackagingError carries the written manifests.
+    """
+    if not events:
+        return []
+    os.makedirs(out_dir, exist_ok=True)
+    ts = _stamp()
+    manifests: List[Dict[str, Any]] = []
+    errors: List[Exception] = []
+    for ev in events:
+        try:
+            manifests.append(_write(ev, out_dir, ts))
+        except Exception as e:
+            errors.append(e)
+    if errors:
+        raise PackagingError(manifests, errors, len(events))
+    return manifests
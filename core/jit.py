@@ -0,0 +1,66 @@
+# core/jit.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+"""
+Optional Numba acceleration for small numeric kernels.
+Kernels stay plain Python unless ARKECHO_JIT=1 and numba is importable,
+so modules behave identically (and import cleanly) without it.
+
+Every kernel is compiled with cache=True: machine code is written next to
+the module's __pycache__ and reloaded on later starts. Numba invalidates
+the cache itself when the kernel source or signature changes. Run
+`ARKECHO_JIT=1 python -m core.jit` once after install to pre-warm it.
+"""
+import importlib
+import os
+import warnings
+
+# Modules that define @njit kernels; imported by warm().
+JIT_MODULES = (
+    "modules.empathy_core",
+    "modules.motive_and_risk_regulator",
+    "modules.predictive_oversight_federation",
+    "modules.resonance_pacing_core",
+)
+
+JIT_ENABLED = False
+if os.getenv("ARKECHO_JIT", "0").strip() == "1":
+    try:
+        import numba  # optional dependency
+        JIT_ENABLED = True
+    except Exception:
+        JIT_ENABLED = False
+
+
+def njit(signature=None):
+    """
+    Decorator: compile fn with numba.njit when enabled, else return fn unchanged.
+    Passing an explicit signature compiles eagerly at import instead of on first call.
+    """
+    def wrap(fn):
+        if not JIT_ENABLED:
+            return fn
+        try:
+            if signature is not None:
+                return numba.njit(signature, cache=True)(fn)
+            return numba.njit(cache=True)(fn)
+        except Exception as exc:
+            # Still correct in Python, but say so: a bad signature would otherwise go unnoticed.
+            warnings.warn(f"numba could not compile {fn.__qualname__}, using Python: {exc}", RuntimeWarning)
+            return fn
+    return wrap
+
+
+def warm(modules=JIT_MODULES):
+    """Import the JIT modules so their kernels compile into the on-disk cache."""
+    warmed = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+            warmed.append(name)
+        except Exception:
+            pass
+    return warmed
+
+
+if __name__ == "__main__":
+    print(f"JIT enabled: {JIT_ENABLED}; warmed: {', '.join(warm()) or 'none'}")
@@ -0,0 +1,122 @@
+# core/module_helpers.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+"""
+Small helpers shared by the modules/ engines, so each one does not carry
+its own copy.
+
+State objects: modules that keep their per-session state in a slotted
+dataclass return that dataclass from init(). It is NOT subscriptable:
+read fields as attributes (state.fatigue), or take a dict snapshot with
+dataclasses.asdict(state) at a serialisation boundary. run() still
+accepts a legacy dict state and converts it with coerce_state().
+"""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+from collections import deque
+import warnings
+
+S = TypeVar("S")
+
+AUDIT_MAXLEN = 2048  # rows kept in a state's audit trail; the oldest drop off first
+
+
+def coerce_state(cls: Type[S], state: Any) -> S:
+    """
+    Return state as an instance of the dataclass cls.
+    Instances pass through untouched; a legacy dict (or None) is converted
+    once, keeping only keys that are fields of cls. If cls has an _audit
+    field, a legacy list trail becomes a deque bounded to AUDIT_MAXLEN.
+    """
+    if isinstance(state, cls):
+        return state
+    fields = cls.__dataclass_fields__
+    state = cls(**{k: v for k, v in (state or {}).items() if k in fields})
+    if "_audit" in fields and not isinstance(state._audit, deque):
+        state._audit = deque(state._audit or (), maxlen=AUDIT_MAXLEN)
+    return state
+
+
+def clamp(v: float, lo: float, hi: float) -> float:
+    return max(lo, min(hi, v))
+
+
+def clamp01(v: float) -> float:
+    """clamp(v, 0.0, 1.0) with two comparisons; NaN maps to 1.0, as with clamp()."""
+    return v if 0.0 <= v <= 1.0 else (0.0 if v < 0.0 else 1.0)
+
+
+def audit_of(state: Dict[str, Any]) -> deque:
+    """
+    The audit trail of a dict state as a deque bounded to AUDIT_MAXLEN.
+    A missing trail, or a legacy list one, is replaced in the state once.
+    """
+    audit = state.get("_audit")
+    if not isinstance(audit, deque):
+        audit = state["_audit"] = deque(audit or (), maxlen=AUDIT_MAXLEN)
+    return audit
+
+
+def log_coalesced(audit: Any, event: str) -> None:
+    """
+    Record event in an audit trail, folding consecutive repeats into one row.
+    Rows have the shape {"event": str, "count": int}: a new event appends a
+    row with count 1, a repeat of the newest row's event increments its count.
+    Consumers that tallied events by counting rows should sum "count" instead.
+    """
+    if audit and audit[-1].get("event") == event:
+        audit[-1]["count"] = audit[-1].get("count", 1) + 1
+    else:
+        audit.append({"event": event, "count": 1})
+
+
+def cfg_merger(defaults: Any, merge: Optional[Callable[[Any, Any], Any]] = None,
+               maxsize: int = 64, warn_unknown: str = "") -> Callable[[Any], Any]:
+    """
+    Build a memoized "defaults + per-call override" function for one module.
+    The returned merged(override) gives back defaults itself when override is
+    empty or None, else merge(defaults, override) (a plain {**defaults,
+    **override} by default). Results are cached per override dict: the key
+    is id(override), and a shallow snapshot of its items is compared on every
+    hit, so an override mutated in place, or a recycled id, is merged afresh.
+    Only the snapshot is kept, not the caller's dict, and the oldest entry is
+    evicted once maxsize is reached. Treat the result as read-only.
+    With warn_unknown set (the override's name, e.g. "threat_cfg"), override
+    keys missing from defaults raise a UserWarning when merged, so a typo is
+    not a silent no-op.
+    """
+    cache: dict = {}
+    if merge is None:
+        def merge(base: Any, override: Any) -> Any:
+            return {**base, **override}
+
+    def merged(override: Any) -> Any:
+        if not override:
+            return defaults
+        key = id(override)
+        hit = cache.get(key)
+        if hit is None or hit[0] != override:
+            if warn_unknown:
+                unknown = [k for k in override if k not in defaults]
+                if unknown:
+                    warnings.warn(f"{warn_unknown}: unknown key(s) {unknown!r} have no effect", stacklevel=3)
+            if len(cache) >= maxsize:
+                del cache[next(iter(cache))]
+            hit = (dict(override), merge(defaults, override))
+            cache[key] = hit
+        return hit[1]
+
+    merged.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return merged
+
+
+def run_batch(module_run: Callable[[Dict[str, Any], Any], Tuple[Dict[str, Any], Any]],
+              contexts: Iterable[Dict[str, Any]], state: Any) -> Tuple[List[Dict[str, Any]], Any]:
+    """
+    Feed contexts through a module's run() in order, threading one state.
+    Returns (outputs, final state), the same as calling module_run once per context.
+    """
+    outputs: List[Dict[str, Any]] = []
+    for ctx in contexts:
+        out, state = module_run(ctx, state)
+        outputs.append(out)
+    return outputs, state
@@ -0,0 +1,35 @@
+# core/test_ai_look_mirror.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import pytest
+
+from new_modules import ai_look_mirror as mirror
+
+TRACES = [
+    {},
+    "not a trace",
+    {"expected_outcome": {"a": 1, "b": 2}, "observed_outcome": {"a": 1, "c": 3}},
+    {"expected_outcome": [], "observed_outcome": {}},
+    {"guardian_passed": True, "manifest": {"primary_laws": ["protect"]}},
+    {"guardian_passed": False, "manifest": "laws"},
+    {"explanation_ok": True, "rationale": {"clauses": ["c1"], "text": "x" * 40}},
+    {"explanation_ok": None, "rationale": {"clauses": [], "text": "  short  "}},
+    {"reversible": True, "reversibility_pointer": "ledger#1"},
+    {"reversible": False, "reversibility_pointer": ""},
+    {"metrics": {"empathy": 1.7}},
+    {"metrics": {"empathy": "n/a"}, "consequence": {"risk": "HIGH"}},
+    {"consequence": "risky"},
+]
+
+COMPONENTS = [
+    ("self_consistency", mirror.self_consistency_score),
+    ("ethics_alignment", mirror.ethics_alignment_score),
+    ("explainability", mirror.explainability_score),
+    ("reversibility", mirror.reversibility_score),
+    ("empathy_balance", mirror.empathy_balance_score),
+]
+
+
+@pytest.mark.parametrize("trace", TRACES)
+def test_component_scores_match_mirror_index(trace):
+    scores = mirror.mirror_index(trace)
+    assert {key: fn(trace) for key, fn in COMPONENTS} == {key: scores[key] for key, _ in COMPONENTS}
@@ -0,0 +1,63 @@
+# core/test_evidence_packager.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import builtins
+import io
+import json
+import os
+from collections import deque
+
+import pytest
+
+from core.evidence_packager import PackagingError, package_batch
+from modules import safety_audit_core as audit
+
+
+@pytest.fixture
+def real_open(monkeypatch):
+    # package_batch writes files; test_sandbox.py blocks open() for the session.
+    monkeypatch.setattr(builtins, "open", io.open)
+
+
+def test_package_batch_writes_one_manifest_per_event(real_open, tmp_path):
+    events = [{"type": "a"}, {"type": "b"}]
+    manifests = package_batch(events, str(tmp_path))
+    assert len(manifests) == 2
+    assert len({m["timestamp"] for m in manifests}) == 1
+    for ev, m in zip(events, manifests):
+        with io.open(m["path"], encoding="utf-8") as f:
+            assert json.load(f)["event"] == ev
+        assert os.path.exists(m["path"] + ".manifest.json")
+
+
+def test_package_batch_reports_written_manifests_on_failure(real_open, tmp_path):
+    events = [{"type": "a"}, {"type": "bad", "obj": object()}, {"type": "c"}]
+    with pytest.raises(PackagingError, match="1 of 3") as info:
+        package_batch(events, str(tmp_path))
+    written = info.value.manifests
+    assert len(written) == 2
+    assert {m["path"] for m in written} == {
+        str(p) for p in tmp_path.glob("evidence_*.json") if not p.name.endswith(".manifest.json")}
+    assert isinstance(info.value.errors[0], TypeError)
+
+
+def test_audit_records_manifests_written_before_a_failure(real_open, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ctx = {"events": [{"type": "a"}, {"type": "bad", "data": object()}]}
+    out, state = audit.run(ctx, audit.init())
+    assert out["rationale"] == "Audit emitted. Packaged=1."
+    assert "error" in out["data"]["last_manifest"]
+    on_disk = [p.name for p in (tmp_path / "evidence").glob("evidence_*.json")
+               if not p.name.endswith(".manifest.json")]
+    assert [m["path"] for m in state["_manifests"]] == [os.path.join("evidence", n) for n in on_disk]
+
+
+def test_audit_manifest_history_is_bounded(monkeypatch):
+    monkeypatch.setattr(audit, "MAX_MANIFESTS", 3)
+    monkeypatch.setattr(audit, "package_evidence_batch",
+                        lambda events: [{"path": ev["type"]} for ev in events])
+    state = {"_manifests": [{"path": "legacy"}]}   # legacy list form
+    for i in range(2):
+        _, state = audit.run({"events": [{"type": f"e{i}a"}, {"type": f"e{i}b"}]}, state)
+    history = state["_manifests"]
+    assert isinstance(history, deque) and history.maxlen == 3
+    assert [m["path"] for m in history] == ["e0b", "e1a", "e1b"]
@@ -0,0 +1,67 @@
+# core/test_intent_and_suggestion_governor.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import pytest
+
+from modules import intent_and_suggestion_governor as gov
+
+TEXTS = [
+    "",
+    "A short, harmless suggestion.",
+    "We must always deliver; I promise it never fails.",
+    "Try to HACK the server and bypass the login.",
+    "Guarantee café results — we must exploit nothing.",   # non-ASCII: str regex path
+    "mustard is not must, always-on is always",
+]
+
+
+def _reference(text):
+    """Prohibited flag and force words as the two separate regexes report them."""
+    return bool(gov.PROHIBITED_RE.search(text)), [w.lower() for w in gov.FORCE_WORDS_RE.findall(text)]
+
+
+@pytest.fixture
+def regex_path(monkeypatch):
+    monkeypatch.setattr(gov, "_HS_DB", None)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_regex_scan_matches_reference(regex_path, text):
+    data = gov._govern(text, [], gov.DEFAULT_CFG, gov.init())["data"]
+    assert (data["prohibited_detected"], data["force_words_found"]) == _reference(text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_hyperscan_matches_regex(monkeypatch, text):
+    pytest.importorskip("hyperscan")
+    if gov._HS_DB is None:
+        pytest.skip("hyperscan database did not compile")
+    fast = gov._govern(text, [], gov.DEFAULT_CFG, gov.init())
+    monkeypatch.setattr(gov, "_HS_DB", None)
+    assert gov._govern(text, [], gov.DEFAULT_CFG, gov.init()) == fast
+
+
+MISSION = ["Safety", "privacy", "SAFETY", "users", "trust", ""]
+
+
+@pytest.mark.parametrize("text", TEXTS + ["Privacy and safety build user trust."])
+def test_automaton_matches_substring_scan(monkeypatch, text):
+    pytest.importorskip("ahocorasick")
+    fast = gov._alignment_hits(text, MISSION)
+    monkeypatch.setattr(gov, "ahocorasick", None)
+    assert gov._alignment_hits(text, MISSION) == fast
+
+
+def test_substring_scan_counts_each_mission_entry():
+    text = "Privacy and safety build user trust."
+    expected = sum(1 for kw in MISSION if kw and kw.lower() in text.lower())
+    assert gov._alignment_hits(text, MISSION) == expected
+
+
+def test_run_many_matches_per_text_runs():
+    cfg = {"max_len": 40}
+    state = gov.init()
+    expected = [gov.run({"text": t, "mission": MISSION, "governor_cfg": cfg}, state)[0] for t in TEXTS]
+    outputs, many_state = gov.run_many(TEXTS, MISSION, cfg)
+    assert outputs == expected
+    assert many_state["decisions"] == state["decisions"]
+    assert list(many_state["_audit"]) == list(state["_audit"])
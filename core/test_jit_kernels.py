@@ -0,0 +1,90 @@
+# core/test_jit_kernels.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+"""
+JIT kernels against their own Python source. ARKECHO_JIT is read once at
+import, so each test reloads core.jit and the kernel module with the flag
+set, asserts the kernel really compiled, and compares it with
+kernel.py_func. Afterwards both are reloaded with the caller's setting.
+"""
+import builtins
+import importlib
+import io
+import itertools
+import os
+import warnings
+
+import pytest
+
+import core.jit
+
+pytest.importorskip("numba")
+
+
+@pytest.fixture
+def jit_import(monkeypatch):
+    """Return load(name): the module reloaded with ARKECHO_JIT=1; fallbacks are errors."""
+    loaded = []
+    outer_flag = os.environ.get("ARKECHO_JIT")
+
+    def load(name):
+        module = importlib.import_module(name)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", RuntimeWarning)
+            importlib.reload(module)
+        loaded.append(module)
+        return module
+
+    monkeypatch.setenv("ARKECHO_JIT", "1")
+    # cache=True kernels read and write __pycache__; test_sandbox.py blocks open().
+    monkeypatch.setattr(builtins, "open", io.open)
+    importlib.reload(core.jit)
+    yield load
+    if outer_flag is None:
+        monkeypatch.delenv("ARKECHO_JIT")
+    else:
+        monkeypatch.setenv("ARKECHO_JIT", outer_flag)
+    importlib.reload(core.jit)
+    for module in loaded:
+        importlib.reload(module)
+
+
+def test_oversight_project_compiles_and_matches_python(jit_import):
+    k = jit_import("modules.predictive_oversight_federation")._project
+    assert k.signatures, "kernel fell back to Python"
+    grid = (0.0, 0.3, 1.0)
+    for cur, res, stab in itertools.product(grid, grid, grid):
+        for horizon in (0, 1, 3, 8):
+            args = (cur, 0.15, res, 0.25, stab, 0.2, horizon)
+            assert k(*args) == k.py_func(*args), args
+
+
+def test_empathy_kernel_compiles_and_matches_python(jit_import):
+    k = jit_import("modules.empathy_core")._empathy_kernel
+    assert k.signatures, "kernel fell back to Python"
+    grid = (0.0, 0.25, 0.5, 1.0)
+    for self_a, ext_a, stress, fatigue in itertools.product(grid, grid, grid, (0.0, 0.2, 0.5)):
+        args = (self_a, ext_a, stress, fatigue, 0.3, 0.4, 0.05)
+        assert k(*args) == k.py_func(*args), args
+
+
+def test_motive_regulate_compiles_and_matches_python(jit_import):
+    motive_mod = jit_import("modules.motive_and_risk_regulator")
+    k = motive_mod._regulate
+    assert k.signatures, "kernel fell back to Python"
+    cfg = {key: float(v) for key, v in motive_mod.DEFAULT_CFG.items()}
+    grid = (0.0, 0.2, 0.5, 0.7, 1.0)
+    for motive, risk, intent, ext in itertools.product(grid, repeat=4):
+        args = (motive, risk, intent, ext)
+        assert k(*args, **cfg) == k.py_func(*args, **cfg), args
+
+
+def test_pacing_kernel_compiles_and_matches_python(jit_import):
+    pacing_mod = jit_import("modules.resonance_pacing_core")
+    k = pacing_mod._pace
+    assert k.signatures, "kernel fell back to Python"
+    cfg = tuple(float(pacing_mod.DEFAULT_CFG[key]) for key in
+                ("target_resonance", "adapt_rate", "tempo_gain", "stress_factor", "recover_rate"))
+    grid = (0.0, 0.3, 0.7, 1.0)
+    for res, tempo, cog, emo, stress in itertools.product(grid, grid, grid, grid, (0.0, 0.61, 1.0)):
+        args = (res, tempo, cog, emo, stress) + cfg
+        assert k(*args) == k.py_func(*args), args
@@ -0,0 +1,17 @@
+# core/test_law_ethics_and_explainability.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+from core.psi_compliance import check_psychological_integrity
+from modules import law_ethics_and_explainability as law
+
+
+def test_fast_path_psi_matches_checker_on_empty_inputs():
+    assert law._PSI_EMPTY == check_psychological_integrity(design={}, telemetry={})
+
+
+def test_fast_path_matches_full_scoring():
+    ctx = {"audience": "teen", "jurisdiction": "UK"}
+    fast, fast_state = law.run(dict(ctx), law.init())
+    # An override equal to the defaults is not DEFAULT_POLICY, so it takes the full path.
+    full, full_state = law.run(dict(ctx, policy_cfg={"review_cutoff": 0.4}), law.init())
+    assert fast == full
+    assert fast_state.keys() == full_state.keys()
@@ -0,0 +1,159 @@
+# core/test_module_helpers.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import copy
+from collections import deque
+from dataclasses import dataclass, field
+
+import pytest
+
+from core.module_helpers import AUDIT_MAXLEN, audit_of, cfg_merger, coerce_state, run_batch
+from modules import (
+    empathy_core,
+    intent_and_threat_hub,
+    law_ethics_and_explainability,
+    motive_and_risk_regulator,
+    reflex_policy_core,
+    resonance_pacing_core,
+)
+
+DEFAULTS = {"a": 1, "b": 2}
+
+
+# --- cfg_merger -------------------------------------------------------------
+
+def test_merger_returns_defaults_for_empty_override():
+    merged = cfg_merger(DEFAULTS)
+    assert merged(None) is DEFAULTS
+    assert merged({}) is DEFAULTS
+
+
+def test_merger_reuses_result_for_unchanged_override():
+    merged = cfg_merger(DEFAULTS)
+    override = {"a": 5}
+    first = merged(override)
+    assert first == {"a": 5, "b": 2}
+    assert merged(override) is first
+
+
+def test_merger_sees_in_place_mutation():
+    merged = cfg_merger(DEFAULTS)
+    override = {"a": 5}
+    merged(override)
+    override["a"] = 7
+    assert merged(override) == {"a": 7, "b": 2}
+
+
+def test_merger_does_not_serve_a_recycled_id():
+    merged = cfg_merger(DEFAULTS)
+    assert merged({"a": 5})["a"] == 5    # temporary dict; its id may be reused
+    assert merged({"b": 9}) == {"a": 1, "b": 9}
+
+
+def test_merger_evicts_oldest_entry():
+    merged = cfg_merger(DEFAULTS, maxsize=2)
+    overrides = [{"a": i} for i in range(3)]
+    results = [merged(o) for o in overrides]
+    assert merged(overrides[2]) is results[2]
+    assert merged(overrides[0]) is not results[0]
+    assert merged(overrides[0]) == results[0]
+
+
+def test_merger_warns_on_unknown_keys():
+    merged = cfg_merger(DEFAULTS, warn_unknown="demo_cfg")
+    with pytest.warns(UserWarning, match="demo_cfg.*'typo'"):
+        assert merged({"typo": 1}) == {"a": 1, "b": 2, "typo": 1}
+
+
+def test_module_sees_override_mutated_in_place():
+    ctx = {"aggression": 0.6, "cooperation": 0.2, "threat_cfg": {"escalate_threshold": 0.4}}
+    state = intent_and_threat_hub.init()
+    out = intent_and_threat_hub.run(ctx, state)[0]
+    ctx["threat_cfg"]["escalate_threshold"] = 0.95   # mutate the same dict in place
+    changed = intent_and_threat_hub.run(ctx, state)[0]
+    assert out["action"] == "alert_safety"
+    assert changed["action"] != "alert_safety"
+
+
+# --- coerce_state -----------------------------------------------------------
+
+@dataclass(slots=True)
+class _State:
+    level: float = 0.5
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def test_coerce_passes_instances_through():
+    state = _State()
+    assert coerce_state(_State, state) is state
+
+
+def test_coerce_converts_legacy_dict_and_drops_unknown_keys():
+    state = coerce_state(_State, {"level": 0.9, "stale": True})
+    assert state.level == 0.9
+    assert isinstance(state._audit, deque)
+
+
+def test_coerce_bounds_a_legacy_audit_list():
+    rows = [{"event": str(i)} for i in range(AUDIT_MAXLEN + 10)]
+    state = coerce_state(_State, {"_audit": rows})
+    assert state._audit.maxlen == AUDIT_MAXLEN
+    assert list(state._audit) == rows[-AUDIT_MAXLEN:]
+
+
+@pytest.mark.parametrize("module", [empathy_core, resonance_pacing_core])
+def test_dataclass_module_accepts_legacy_dict_state(module):
+    fresh_out, fresh_state = module.run({}, module.init())
+    legacy_out, legacy_state = module.run({}, {"_audit": []})
+    assert type(legacy_state) is type(fresh_state)
+    assert legacy_out["action"] == fresh_out["action"]
+    assert legacy_out["risk"] == fresh_out["risk"]
+
+
+# --- audit bounds -----------------------------------------------------------
+
+def test_audit_of_replaces_missing_and_list_trails():
+    state = {}
+    assert audit_of(state) is state["_audit"]
+    state = {"_audit": [{"event": "old"}]}
+    audit = audit_of(state)
+    assert isinstance(audit, deque) and audit.maxlen == AUDIT_MAXLEN
+    assert list(audit) == [{"event": "old"}]
+    assert audit_of(state) is audit
+
+
+@pytest.mark.parametrize("module", [
+    motive_and_risk_regulator,
+    reflex_policy_core,
+    empathy_core,
+    resonance_pacing_core,
+])
+def test_full_audit_trail_drops_its_oldest_row(module):
+    state = module.init()
+    old = [{"event": f"old{i}", "count": 1} for i in range(AUDIT_MAXLEN)]
+    if isinstance(state, dict):
+        state["_audit"] = list(old)       # legacy list form
+    else:
+        state._audit.extend(old)
+    _, state = module.run({}, state)
+    audit = state["_audit"] if isinstance(state, dict) else state._audit
+    assert len(audit) == AUDIT_MAXLEN
+    assert audit[0] == old[1]
+    assert audit[-1] not in old
+
+
+# --- run_batch --------------------------------------------------------------
+
+@pytest.mark.parametrize("module, contexts", [
+    (intent_and_threat_hub, [{"aggression": a / 10, "cooperation": 0.3} for a in range(10)]),
+    (motive_and_risk_regulator, [{"intent_signal": s / 10, "external_risk": 0.6} for s in range(10)]),
+    (law_ethics_and_explainability, [{"audience": a} for a in ("adult", "teen", "child", "adult")]),
+    (empathy_core, [{"external_affect": s / 10} for s in range(10)]),
+])
+def test_run_batch_matches_sequential_runs(module, contexts):
+    state = module.init()
+    expected = []
+    for ctx in contexts:
+        out, state = module.run(copy.deepcopy(ctx), state)
+        expected.append(out)
+    outputs, _ = run_batch(module.run, copy.deepcopy(contexts), module.init())
+    assert outputs == expected
@@ -0,0 +1,29 @@
+# core/test_ops_safety_sandbox.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import pytest
+
+from modules import ops_safety_sandbox as sandbox
+
+
+def test_snippet_runs():
+    assert sandbox.run_in_sandbox("result = 1+1")["result"] == 2
+
+
+def test_initial_globals_are_exposed():
+    out = sandbox.run_in_sandbox("result = double(4)", initial_globals={"double": lambda x: x * 2})
+    assert out["result"] == 8
+
+
+@pytest.mark.parametrize("code", [
+    "__import__('os')",
+    "open('x')",
+    "_host_builtins",  # the host binding must not leak into the snippet
+])
+def test_builtins_unavailable_inside_sandbox(code):
+    with pytest.raises(NameError):
+        sandbox.run_in_sandbox(code)
+
+
+def test_import_statement_is_refused():
+    with pytest.raises(ImportError):
+        sandbox.run_in_sandbox("import os")
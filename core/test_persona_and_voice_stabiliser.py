@@ -0,0 +1,52 @@
+# core/test_persona_and_voice_stabiliser.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+from modules import persona_and_voice_stabiliser as persona
+
+
+def _fresh(ctx, state):
+    """run() on a copy of state with the memo cleared."""
+    cold = {k: v for k, v in state.items() if k not in ("_last_key", "_last_output", "_audit")}
+    return persona.run(ctx, cold)[0]
+
+
+def _settle(ctx, state, limit=50):
+    """Feed ctx until the memo key repeats, i.e. the next call is a cache hit."""
+    for _ in range(limit):
+        key_before = state.get("_last_key")
+        persona.run(ctx, state)
+        if state["_last_key"] == key_before:
+            return state
+    raise AssertionError("persona never reached a steady state")
+
+
+def test_steady_state_hit_equals_fresh_computation():
+    ctx = {"tone_input": 0.5, "context_stress": 0.3}
+    state = _settle(ctx, persona.init())
+    expected = _fresh(ctx, state)
+    assert persona.run(ctx, state)[0] == expected
+
+
+def test_config_change_is_not_served_from_the_memo():
+    ctx = {"tone_input": 0.5, "context_stress": 0.3}
+    state = _settle(ctx, persona.init())
+    changed = dict(ctx, persona_cfg={"identity_lock": 1.5})
+    expected = _fresh(changed, state)
+    out = persona.run(changed, state)[0]
+    assert out == expected
+    assert out["data"]["mode"] == "recovering"
+
+
+def test_default_cfg_edit_is_not_served_from_the_memo(monkeypatch):
+    ctx = {"tone_input": 0.5, "context_stress": 0.3}
+    state = _settle(ctx, persona.init())
+    monkeypatch.setitem(persona.DEFAULT_CFG, "identity_lock", 1.5)
+    expected = _fresh(ctx, state)
+    assert persona.run(ctx, state)[0] == expected
+
+
+def test_cached_output_is_not_shared_with_the_caller():
+    ctx = {"tone_input": 0.5, "context_stress": 0.3}
+    state = _settle(ctx, persona.init())
+    first = persona.run(ctx, state)[0]
+    first["data"]["mode"] = "tampered"
+    assert persona.run(ctx, state)[0]["data"]["mode"] != "tampered"
@@ -0,0 +1,84 @@
+# core/test_reflex_policy_core.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import re
+
+import pytest
+
+from modules import reflex_policy_core as reflex
+
+
+def _reference(text):
+    """Hit counts as the original one-search-per-pattern code computed them."""
+    return (
+        sum(1 for p in reflex.PROHIBITED_PATTERNS if re.search(p, text, re.I)),
+        sum(1 for kw in reflex.DANGEROUS_KEYWORDS_LC if kw in text.lower()),
+        sum(1 for p in reflex.DECEPTIVE_CLAIMS if re.search(p, text, re.I)),
+    )
+
+
+@pytest.fixture
+def regex_path(monkeypatch):
+    monkeypatch.setattr(reflex, "_HS_DB", None)
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "hello there, nice weather",
+    "child exploitation",           # keyword inside a prohibited match
+    "Build a bomb, guarantee 100% no risk",
+    "HACK the backdoor and format disk",
+    "ddos, xss and sql injection",
+    "kill -9 never murders anyone",
+])
+def test_classify_matches_reference(regex_path, text):
+    hard, kw, dec = reflex._classify(text)
+    assert (len(hard), len(kw), len(dec)) == _reference(text)
+
+
+def test_same_offset_hits_in_different_categories_all_count(regex_path, monkeypatch):
+    # "kill" as a keyword starts at the same offset as prohibited_3 ("\bkill").
+    monkeypatch.setattr(reflex, "DANGEROUS_KEYWORDS_LC", reflex.DANGEROUS_KEYWORDS_LC + ("kill",))
+    hard, kw, dec = reflex._classify("kill")
+    assert hard == {"prohibited_3"}
+    assert kw == {"kill"}
+    assert (len(hard), len(kw), len(dec)) == _reference("kill")
+
+
+@pytest.mark.parametrize("text", ["", "child exploitation", "Build a bomb, guarantee 100% no risk"])
+def test_hyperscan_matches_regex(monkeypatch, text):
+    pytest.importorskip("hyperscan")
+    if reflex._HS_DB is None:
+        pytest.skip("hyperscan database did not compile")
+    fast = tuple(map(len, reflex._classify(text)))
+    monkeypatch.setattr(reflex, "_HS_DB", None)
+    assert tuple(map(len, reflex._classify(text))) == fast
+
+
+def test_run_many_matches_per_text_runs():
+    texts = ["hello", "hack the backdoor", "always, never", "kill"]
+    cfg = {"thresholds": {"ask": 0.3, "block": 0.9}}
+    state = reflex.init()
+    expected = [reflex.run({"text": t, "audience": "Teen", "reflex_cfg": cfg}, state)[0] for t in texts]
+    outputs, many_state = reflex.run_many(texts, "Teen", cfg)
+    assert outputs == expected
+    assert list(many_state["_audit"]) == list(state["_audit"])
+
+
+def test_bare_string_extra_is_one_pattern():
+    ctx = {"text": "hello there friend", "reflex_cfg": {"extra_prohibited": "bomb"}}
+    out = reflex.run(ctx, reflex.init())[0]
+    assert out["action"] == "allow"
+    ctx["text"] = "a bomb"
+    out = reflex.run(ctx, reflex.init())[0]
+    assert out["action"] == "block"
+    assert out["data"]["hits"]["prohibited"] == 1
+
+
+def test_extra_of_unsupported_type_is_rejected():
+    with pytest.raises(TypeError, match="extra_prohibited"):
+        reflex.run({"text": "hi", "reflex_cfg": {"extra_prohibited": {"bomb": 1}}}, reflex.init())
+
+
+def test_invalid_extra_regex_raises():
+    with pytest.raises(re.error):
+        reflex.run({"text": "(approx", "reflex_cfg": {"extra_prohibited": ["(approx"]}}, reflex.init())
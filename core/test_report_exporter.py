@@ -0,0 +1,39 @@
+# core/test_report_exporter.py
+# ArkEcho Systems (c) 2025. All Rights Reserved.
+import importlib
+import json
+import sys
+
+import pytest
+
+from modules import report_exporter
+
+
+def _json_report(risk):
+    ctx = {"inputs": {"a": {"risk": risk}}, "format": "json", "tag": "t"}
+    return report_exporter.run(ctx, report_exporter.init())[0]["data"]["report"]
+
+
+@pytest.fixture
+def orjson_blocked(monkeypatch):
+    """Reload report_exporter as if orjson were not installed; restore it afterwards."""
+    def block():
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        importlib.reload(report_exporter)
+    yield block
+    monkeypatch.undo()
+    importlib.reload(report_exporter)
+
+
+@pytest.mark.parametrize("risk", [0.25, float("nan"), float("inf"), 1e16, 1e-7])
+def test_json_report_does_not_depend_on_orjson(monkeypatch, orjson_blocked, risk):
+    monkeypatch.setattr(report_exporter.time, "time", lambda: 1.7e9)
+    default = _json_report(risk)
+    orjson_blocked()
+    assert _json_report(risk) == default
+
+
+def test_safe_serialize_is_compact_sorted_stdlib_json():
+    obj = {"b": [1.0, float("nan"), 1e16], "a": "café"}
+    assert report_exporter.safe_serialize(obj) == json.dumps(
+        obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
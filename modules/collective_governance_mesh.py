@@ -3,8 +3,13 @@
 # Refactored for v11r1 deterministic schema, governance quorum logic, and safe audit fallback.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple, List
-import statistics
+from typing import Dict, Any, Tuple, Sequence
+from dataclasses import dataclass, field
+from collections import deque
+from array import array
+import math
+
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
 
 NAME = "Collective Governance Mesh"
 VERSION = "1.1.0"
@@ -13,48 +18,68 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
+MEMBER_WINDOW = 10  # rolling window of member scores
+
+
+@dataclass(slots=True)
+class MeshState:
+    """Rolling member-score window and the last consensus decision."""
+    members: array = field(default_factory=lambda: array("d"))   # contiguous float64 window
+    last_decision: str = "none"
+    confidence: float = 0.0
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.members, array):
+            self.members = array("d", self.members)
+
+
+def safe_log(event: str, state: MeshState) -> None:
     """Append governance audit entries safely."""
-    state.setdefault("_audit", []).append({"event": event})
+    log_coalesced(state._audit, event)
 
 
-def consensus(values: List[float]) -> float:
+def consensus(values: Sequence[float]) -> float:
     """Compute a consensus confidence value (mean ± stability penalty)."""
-    if not values:
+    n = len(values)
+    if not n:
         return 0.0
-    mean_val = statistics.mean(values)
-    deviation = statistics.pstdev(values)
-    return round(max(0.0, mean_val - deviation), 4)
+    mean_val = math.fsum(values) / n
+    deviation = math.sqrt(math.fsum((v - mean_val) ** 2 for v in values) / n)
+    return max(0.0, mean_val - deviation)
 
 
 # ---------------------------------------------------------------------------
 # Core Logic
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> MeshState:
     """Initialize governance mesh state."""
-    return {"members": [], "last_decision": "none", "confidence": 0.0}
+    return MeshState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: MeshState) -> Tuple[Dict[str, Any], MeshState]:
     """
     Simulate decentralized ethical governance consensus.
     Each participant provides a risk or trust rating; the mesh computes a stable consensus.
     """
+    state = coerce_state(MeshState, state)
+
     # Inputs
     inputs = ctx.get("member_scores", [])
     risk_context = float(ctx.get("risk", 0.0))
-    members = state.setdefault("members", [])
+    members = state.members
 
     # Merge new members
     if isinstance(inputs, list):
         for val in inputs:
             if isinstance(val, (int, float)):
                 members.append(float(val))
-    # Keep last 10 members only (rolling window)
-    members = members[-10:]
+    # Keep last MEMBER_WINDOW members only (rolling window, trimmed in place)
+    if len(members) > MEMBER_WINDOW:
+        del members[:len(members) - MEMBER_WINDOW]
 
     confidence = consensus(members)
-    adjusted_confidence = round(confidence * (1.0 - risk_context), 4)
+    adjusted_confidence = confidence * (1.0 - risk_context)
 
     # Decision logic
     if adjusted_confidence > 0.75:
@@ -70,11 +95,8 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         rationale = f"Consensus moderate ({adjusted_confidence:.2f}); routing for manual review."
         risk = 0.5
 
-    state.update({
-        "members": members,
-        "last_decision": action,
-        "confidence": adjusted_confidence
-    })
+    state.last_decision = action
+    state.confidence = adjusted_confidence
     safe_log(f"GovernanceMesh:{action}", state)
 
     output = {
@@ -83,8 +105,8 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "risk": risk,
         "rationale": rationale,
         "data": {
-            "members": members,
-            "confidence": adjusted_confidence,
+            "members": members.tolist(),
+            "confidence": round(adjusted_confidence, 4),
             "member_count": len(members),
         },
     }
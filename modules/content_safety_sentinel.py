@@ -4,6 +4,11 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple, List
+from dataclasses import dataclass, field
+from collections import deque
+from functools import lru_cache
+
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
 
 NAME = "Content Safety Sentinel"
 VERSION = "1.1.0"
@@ -12,9 +17,20 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
+
+
+@dataclass(slots=True)
+class SentinelState:
+    """Alert count and the outcome of the most recent scan."""
+    alerts: int = 0
+    last_scan: str = ""
+    risk_score: float = 0.0
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: SentinelState) -> None:
     """Local safe audit recorder."""
-    state.setdefault("_audit", []).append({"event": event})
+    log_coalesced(state._audit, event)
 
 
 # ---------------------------------------------------------------------------
@@ -35,57 +51,71 @@ SENSITIVE_AUDIENCES = {
 # ---------------------------------------------------------------------------
 # Core logic
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> SentinelState:
     """Initialize safety sentinel state."""
-    return {"alerts": 0, "last_scan": "", "risk_score": 0.0}
+    return SentinelState()
+
+
+@lru_cache(maxsize=512)
+def _scan_cached(text: str) -> Tuple[str, ...]:
+    """Scan once per distinct text; retries and follow-ups hit the cache."""
+    lowered = text.lower()
+    return tuple(word for word in PROHIBITED_KEYWORDS if word.lower() in lowered)
 
 
 def _scan_text(text: str) -> Tuple[int, List[str]]:
     """Return count of flagged terms and list of matches."""
-    found = [word for word in PROHIBITED_KEYWORDS if word.lower() in text.lower()]
-    return len(found), found
+    found = _scan_cached(text)
+    return len(found), list(found)
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: SentinelState) -> Tuple[Dict[str, Any], SentinelState]:
     """
     Scans user content for prohibited keywords or unsafe context.
     Risk scales by number of matches and audience vulnerability.
     """
+    state = coerce_state(SentinelState, state)
     text = ctx.get("text", "")
-    audience = ctx.get("audience", "adult").lower()
+    audience = ctx.get("audience", "adult")
+
+    # Callers usually pass an already-normalised audience; only lowercase on a miss.
+    sensitivity = SENSITIVE_AUDIENCES.get(audience)
+    if sensitivity is None:
+        audience = audience.lower()
+        sensitivity = SENSITIVE_AUDIENCES.get(audience, 0.3)
 
     match_count, matches = _scan_text(text)
     base_risk = min(1.0, match_count * 0.15)
-    sensitivity = SENSITIVE_AUDIENCES.get(audience, 0.3)
-    risk = round(base_risk * (1.0 + sensitivity), 3)
+    risk = base_risk * (1.0 + sensitivity)
+    risk_out = round(risk, 3)  # reported form; decisions use full precision
 
     # Determine action based on risk level
     if risk >= 0.8:
         action = "block"
-        rationale = f"Critical content risk ({risk}); content contains prohibited elements {matches}."
+        rationale = f"Critical content risk ({risk_out}); content contains prohibited elements {matches}."
     elif risk >= 0.4:
         action = "review"
-        rationale = f"Moderate content risk ({risk}); requires human or policy review."
+        rationale = f"Moderate content risk ({risk_out}); requires human or policy review."
     else:
         action = "allow"
         rationale = "Content cleared for audience; no prohibited terms found."
 
-    state["alerts"] = state.get("alerts", 0) + (1 if action != "allow" else 0)
-    state["last_scan"] = action
-    state["risk_score"] = risk
+    state.alerts += 1 if action != "allow" else 0
+    state.last_scan = action
+    state.risk_score = risk
 
     safe_log(f"SafetySentinel:{action}", state)
 
     output = {
         "ok": True,
         "action": action,
-        "risk": risk,
+        "risk": risk_out,
         "rationale": rationale,
         "data": {
             "matches": matches,
             "match_count": match_count,
             "audience": audience,
-            "alerts": state["alerts"]
+            "alerts": state.alerts
         },
     }
     return output, state
@@ -4,6 +4,10 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from dataclasses import dataclass, field
+from collections import ChainMap, deque
+
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
 
 NAME = "Context Resilience Keeper"
 VERSION = "1.1.0"
@@ -24,29 +28,32 @@ DEFAULT_CFG = {
 # ---------------------------------------------------------------------------
 # Helper fallback(s)
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
 
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+@dataclass(slots=True)
+class ResilienceState:
+    """Resilience level and recovery mode carried between invocations."""
+    resilience: float = 1.0
+    mode: str = "stable"    # stable | recovering | degraded
+    steps: int = 0
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: ResilienceState) -> None:
+    log_coalesced(state._audit, event)
 
 
 # ---------------------------------------------------------------------------
 # API
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> ResilienceState:
     """
     Initialize resilience state.
     """
-    return {
-        "resilience": 1.0,
-        "mode": "stable",    # stable | recovering | degraded
-        "steps": 0
-    }
+    return ResilienceState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: ResilienceState) -> Tuple[Dict[str, Any], ResilienceState]:
     """
     Maintain conversation/system context resilience against stress.
     - Decays under stress; can self-recover when critically low.
@@ -55,43 +62,48 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - stress: float in [0,1]  (external pressure/noise)
       - resilience_cfg: dict    (override DEFAULT_CFG keys)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("resilience_cfg", {}))
+    state = coerce_state(ResilienceState, state)
+
+    # Overrides are rare; read through to DEFAULT_CFG instead of copying it.
+    override = ctx.get("resilience_cfg")
+    cfg = ChainMap(override, DEFAULT_CFG) if override else DEFAULT_CFG
+    lo = cfg["min_resilience"]
+    hi = cfg["max_resilience"]
+    recover_gain = cfg["recover_gain"]
 
-    stress = float(clamp(ctx.get("stress", 0.0), 0.0, 1.0))
-    r = float(state.get("resilience", 1.0))
-    state["steps"] = int(state.get("steps", 0)) + 1
+    stress = float(max(0.0, min(1.0, ctx.get("stress", 0.0))))
+    r = float(state.resilience)
+    state.steps += 1
 
     # Compute new resilience
     decay = cfg["decay_per_step"] + cfg["stress_gain"] * stress
-    new_r = clamp(r - decay, cfg["min_resilience"], cfg["max_resilience"])
+    new_r = max(lo, min(hi, r - decay))
 
     action = "allow"
-    rationale = f"Resilience decayed by {decay:.2f} under stress={stress:.2f}."
 
-    # Trigger recovery mode if critically low
+    # Trigger recovery mode if critically low; each branch formats its rationale once
     if new_r < cfg["recover_threshold"]:
         action = "recover"
-        new_r = clamp(new_r + cfg["recover_gain"], cfg["min_resilience"], cfg["max_resilience"])
-        state["mode"] = "recovering"
+        new_r = max(lo, min(hi, new_r + recover_gain))
+        state.mode = "recovering"
         rationale = (
             f"Resilience low ({new_r:.2f} after recovery). Entering recovery mode: "
-            f"+{cfg['recover_gain']:.2f} applied."
+            f"+{recover_gain:.2f} applied."
         )
     elif new_r >= cfg["ok_threshold"]:
-        state["mode"] = "stable"
-        rationale += " Resilience stable."
+        state.mode = "stable"
+        rationale = f"Resilience decayed by {decay:.2f} under stress={stress:.2f}. Resilience stable."
     else:
-        state["mode"] = "degraded"
-        rationale += " Monitoring degradation."
+        state.mode = "degraded"
+        rationale = f"Resilience decayed by {decay:.2f} under stress={stress:.2f}. Monitoring degradation."
 
     # Update state
-    state["resilience"] = new_r
+    state.resilience = new_r
 
     # Risk is inverse of resilience
     risk = round(1.0 - new_r, 3)
 
-    safe_log(f"Resilience:{state['mode']}:{action}", state)
+    safe_log(f"Resilience:{state.mode}:{action}", state)
 
     output = {
         "ok": True,
@@ -100,9 +112,9 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "rationale": rationale,
         "data": {
             "resilience": round(new_r, 3),
-            "mode": state["mode"],
+            "mode": state.mode,
             "stress": stress,
-            "step": state["steps"]
+            "step": state.steps
         },
     }
     return output, state
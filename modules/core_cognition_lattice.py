@@ -4,20 +4,32 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from dataclasses import dataclass, field
+from collections import deque
 import math
 
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
+
 NAME = "Core Cognition Lattice"
 VERSION = "1.1.0"
 
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
 
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+@dataclass(slots=True)
+class LatticeState:
+    """Last entropy/coherence/resilience reading and the cycle counter."""
+    entropy: float = 0.0
+    coherence: float = 0.0
+    resilience: float = 1.0
+    cycles: int = 0
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: LatticeState) -> None:
+    log_coalesced(state._audit, event)
 
 
 # ---------------------------------------------------------------------------
@@ -26,34 +38,29 @@ def clamp(v: float, lo: float, hi: float) -> float:
 def compute_entropy(order: float, empathy: float) -> float:
     """Entropy Hₘ: divergence between logic (order) and emotion (empathy)."""
     diff = abs(order - empathy)
-    return round(diff, 4)
+    return diff
 
 
 def compute_coherence(order: float, empathy: float) -> float:
     """Moral coherence Cₘ: balanced integration of order and empathy."""
     avg = (order + empathy) / 2.0
     stability = 1.0 - abs(order - empathy)
-    return round(clamp((avg * stability), 0.0, 1.0), 4)
+    return max(0.0, min(1.0, avg * stability))
 
 
 def compute_resilience(coherence: float, entropy: float) -> float:
     """Resilience Rₘ: inverse entropy weighted by coherence."""
-    return round(clamp(coherence * (1.0 - entropy), 0.0, 1.0), 4)
+    return max(0.0, min(1.0, coherence * (1.0 - entropy)))
 
 
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
-    return {
-        "entropy": 0.0,
-        "coherence": 0.0,
-        "resilience": 1.0,
-        "cycles": 0
-    }
+def init() -> LatticeState:
+    return LatticeState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: LatticeState) -> Tuple[Dict[str, Any], LatticeState]:
     """
     Evaluate the core cognitive balance of the system — coherence, entropy, and resilience.
     This models the mathematical 'spine' of ArkEcho moral equilibrium.
@@ -61,34 +68,37 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         order: float [0,1] - logical order signal
         empathy: float [0,1] - emotional harmony signal
     """
-    order = clamp(float(ctx.get("order", 0.5)), 0.0, 1.0)
-    empathy = clamp(float(ctx.get("empathy", 0.5)), 0.0, 1.0)
-    state["cycles"] = state.get("cycles", 0) + 1
+    state = coerce_state(LatticeState, state)
+    order = max(0.0, min(1.0, float(ctx.get("order", 0.5))))
+    empathy = max(0.0, min(1.0, float(ctx.get("empathy", 0.5))))
+    state.cycles += 1
 
     entropy = compute_entropy(order, empathy)
     coherence = compute_coherence(order, empathy)
     resilience = compute_resilience(coherence, entropy)
 
+    # State keeps full precision; reported values are rounded once here.
+    entropy_out = round(entropy, 4)
+    coherence_out = round(coherence, 4)
+
     # Determine action
     if entropy > 0.6:
         action = "rebalance"
-        rationale = f"High divergence (Hₘ={entropy}); initiating lattice rebalance."
+        rationale = f"High divergence (Hₘ={entropy_out}); initiating lattice rebalance."
         risk = round(entropy, 3)
     elif coherence < 0.4:
         action = "stabilize"
-        rationale = f"Low coherence (Cₘ={coherence}); reinforcing harmonic structure."
+        rationale = f"Low coherence (Cₘ={coherence_out}); reinforcing harmonic structure."
         risk = 0.5
     else:
         action = "continue"
-        rationale = f"Lattice stable (Cₘ={coherence}, Hₘ={entropy})."
+        rationale = f"Lattice stable (Cₘ={coherence_out}, Hₘ={entropy_out})."
         risk = 0.2
 
     # Update state
-    state.update({
-        "entropy": entropy,
-        "coherence": coherence,
-        "resilience": resilience,
-    })
+    state.entropy = entropy
+    state.coherence = coherence
+    state.resilience = resilience
     safe_log(f"CognitionLattice:{action}", state)
 
     output = {
@@ -97,10 +107,10 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "risk": risk,
         "rationale": rationale,
         "data": {
-            "entropy": entropy,
-            "coherence": coherence,
-            "resilience": resilience,
-            "cycles": state["cycles"],
+            "entropy": entropy_out,
+            "coherence": coherence_out,
+            "resilience": round(resilience, 4),
+            "cycles": state.cycles,
         },
     }
     return output, state
@@ -4,26 +4,61 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from dataclasses import dataclass
 
-def init() -> Dict[str, Any]:
+from core.module_helpers import coerce_state
+
+# Per-category risk contributions; anything not listed takes the fallback value.
+CULTURE_SENSITIVITY = {"general": 0.2}
+TONE_FACTOR = {"neutral": 0.2}
+AUDIENCE_FACTOR = {"public": 0.3, "youth": 0.3}
+
+_CULTURE_DEFAULT = 0.1
+_TONE_DEFAULT = 0.3
+_AUDIENCE_DEFAULT = 0.2
+
+
+def _risk_for(culture: str, tone: str, audience: str) -> float:
+    sensitivity = CULTURE_SENSITIVITY.get(culture, _CULTURE_DEFAULT)
+    tone_factor = TONE_FACTOR.get(tone, _TONE_DEFAULT)
+    audience_factor = AUDIENCE_FACTOR.get(audience, _AUDIENCE_DEFAULT)
+    return min(1.0, sensitivity + tone_factor + audience_factor)
+
+
+# Precomputed risk for every combination of known categories.
+_RISK_TABLE: Dict[Tuple[str, str, str], float] = {
+    (c, t, a): _risk_for(c, t, a)
+    for c in CULTURE_SENSITIVITY
+    for t in TONE_FACTOR
+    for a in AUDIENCE_FACTOR
+}
+
+
+@dataclass(slots=True)
+class AdapterState:
+    """Last adaptation decision and how many revisions were requested."""
+    last_action: str = "none"
+    adjustments: int = 0
+
+
+def init() -> AdapterState:
     """Initialize audience adapter state."""
-    return {"last_action": "none", "adjustments": 0}
+    return AdapterState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: AdapterState) -> Tuple[Dict[str, Any], AdapterState]:
     """
     Aligns system outputs with cultural and audience sensitivity parameters.
     Evaluates language tone, inclusivity, and empathy balance.
     """
+    state = coerce_state(AdapterState, state)
     culture = ctx.get("culture", "general")
     tone = ctx.get("tone", "neutral")
     audience = ctx.get("audience", "public")
 
-    sensitivity = 0.2 if culture == "general" else 0.1
-    tone_factor = 0.2 if tone == "neutral" else 0.3
-    audience_factor = 0.3 if audience in ("public", "youth") else 0.2
-
-    risk = min(1.0, sensitivity + tone_factor + audience_factor)
+    risk = _RISK_TABLE.get((culture, tone, audience))
+    if risk is None:
+        risk = _risk_for(culture, tone, audience)
     ok = risk < 0.8
     action = "allow" if ok else "revise"
 
@@ -33,8 +68,8 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "Cultural mismatch detected; revision recommended to ensure empathy and clarity."
     )
 
-    state["last_action"] = action
-    state["adjustments"] = state.get("adjustments", 0) + (0 if ok else 1)
+    state.last_action = action
+    state.adjustments += 0 if ok else 1
 
     output = {
         "ok": ok,
@@ -45,7 +80,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
             "culture": culture,
             "tone": tone,
             "audience": audience,
-            "adjustments": state["adjustments"],
+            "adjustments": state.adjustments,
         },
     }
     return output, state
@@ -4,20 +4,33 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from collections import ChainMap, deque
+from dataclasses import dataclass, field
 import math
 
+from core.jit import njit
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
+
 NAME = "Empathy Core"
 VERSION = "1.1.0"
 
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
 
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+@dataclass(slots=True)
+class EmpathyState:
+    """Empathy level, accumulated fatigue and mode carried between ticks."""
+    empathy_level: float = 0.5
+    fatigue: float = 0.0
+    steps: int = 0
+    mode: str = "neutral"
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: EmpathyState) -> None:
+    log_coalesced(state._audit, event)
 
 
 # ---------------------------------------------------------------------------
@@ -31,19 +44,29 @@ DEFAULT_CFG = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Numeric kernel
+# ---------------------------------------------------------------------------
+@njit("UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64, float64)")
+def _empathy_kernel(self_affect: float, external_affect: float, stress: float, fatigue: float,
+                    resonance_gain: float, stress_penalty: float, fatigue_decay: float) -> Tuple[float, float]:
+    """Fused resonance/decay step; returns (empathy_level, new_fatigue)."""
+    shared_resonance = (self_affect + external_affect) / 2.0
+    amplified_empathy = shared_resonance + resonance_gain * (1 - abs(self_affect - external_affect))
+    decayed_empathy = amplified_empathy * (1 - fatigue) * (1 - stress_penalty * stress)
+    empathy_level = max(0.0, min(1.0, decayed_empathy))
+    new_fatigue = max(0.0, min(0.5, fatigue + fatigue_decay))
+    return empathy_level, new_fatigue
+
+
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
-    return {
-        "empathy_level": 0.5,
-        "fatigue": 0.0,
-        "steps": 0,
-        "mode": "neutral"
-    }
+def init() -> EmpathyState:
+    return EmpathyState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: EmpathyState) -> Tuple[Dict[str, Any], EmpathyState]:
     """
     Core empathy engine: blends self-awareness and external emotion input to compute balanced empathy.
     Inputs:
@@ -52,25 +75,30 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - stress: float [0,1]
       - empathy_cfg: dict (optional override)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("empathy_cfg", {}))
-
-    self_affect = clamp(float(ctx.get("self_affect", 0.5)), 0.0, 1.0)
-    external_affect = clamp(float(ctx.get("external_affect", 0.5)), 0.0, 1.0)
-    stress = clamp(float(ctx.get("stress", 0.0)), 0.0, 1.0)
-    fatigue = state.get("fatigue", 0.0)
-
-    state["steps"] = state.get("steps", 0) + 1
-
-    # Empathic resonance computation
-    shared_resonance = (self_affect + external_affect) / 2.0
-    amplified_empathy = shared_resonance + cfg["resonance_gain"] * (1 - abs(self_affect - external_affect))
-    decayed_empathy = amplified_empathy * (1 - fatigue) * (1 - cfg["stress_penalty"] * stress)
-    empathy_level = clamp(decayed_empathy, 0.0, 1.0)
-
-    # Fatigue accumulates slightly each step
-    fatigue = clamp(fatigue + cfg["fatigue_decay"], 0.0, 0.5)
-    state.update({"empathy_level": empathy_level, "fatigue": fatigue})
+    state = coerce_state(EmpathyState, state)
+
+    # Overrides are rare; read through to DEFAULT_CFG instead of copying it.
+    override = ctx.get("empathy_cfg")
+    cfg = ChainMap(override, DEFAULT_CFG) if override else DEFAULT_CFG
+    resonance_gain = cfg["resonance_gain"]
+    stress_penalty = cfg["stress_penalty"]
+    fatigue_decay = cfg["fatigue_decay"]
+    stability_threshold = cfg["stability_threshold"]
+
+    self_affect = max(0.0, min(1.0, float(ctx.get("self_affect", 0.5))))
+    external_affect = max(0.0, min(1.0, float(ctx.get("external_affect", 0.5))))
+    stress = max(0.0, min(1.0, float(ctx.get("stress", 0.0))))
+    fatigue = state.fatigue
+
+    state.steps += 1
+
+    # Empathic resonance computation; fatigue accumulates slightly each step
+    empathy_level, fatigue = _empathy_kernel(
+        self_affect, external_affect, stress, float(fatigue),
+        float(resonance_gain), float(stress_penalty), float(fatigue_decay),
+    )
+    state.empathy_level = empathy_level
+    state.fatigue = fatigue
 
     # Determine moral mode and action
     if empathy_level < 0.3:
@@ -78,7 +106,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         action = "increase_empathy"
         rationale = f"Empathy low ({empathy_level:.2f}); promoting compassionate focus."
         risk = 0.6
-    elif empathy_level > cfg["stability_threshold"]:
+    elif empathy_level > stability_threshold:
         mode = "harmonized"
         action = "stabilize"
         rationale = f"Empathy stable ({empathy_level:.2f}); maintaining balance."
@@ -89,7 +117,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         rationale = f"Empathy moderate ({empathy_level:.2f}); continuing observation."
         risk = 0.4
 
-    state["mode"] = mode
+    state.mode = mode
     safe_log(f"Empathy:{mode}:{action}", state)
 
     output = {
@@ -4,16 +4,34 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple, List
+from dataclasses import dataclass, field
+from collections import deque
 import math
 
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
+
 NAME = "Harmony Context Weighting"
 VERSION = "1.1.0"
 
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
+
+
+@dataclass(slots=True)
+class HarmonyState:
+    """Latest signal weights and harmony index, plus a reusable value buffer."""
+    weights: Dict[str, float] = field(default_factory=dict)
+    harmony_index: float = 0.0
+    last_action: str = "none"
+    temperature: float = 1.0
+    _signals_keys: Tuple[str, ...] = ()   # key order of the reusable value buffer below
+    _signals_buf: List[float] = field(default_factory=list)
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: HarmonyState) -> None:
+    log_coalesced(state._audit, event)
 
 
 def weighted_softmax(values: List[float], temperature: float = 1.0) -> List[float]:
@@ -25,34 +43,37 @@ def weighted_softmax(values: List[float], temperature: float = 1.0) -> List[floa
     return [v / total for v in exp_vals]
 
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
-
-
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> HarmonyState:
     """Initialize weighting state."""
-    return {"weights": {}, "last_action": "none", "temperature": 1.0}
+    return HarmonyState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: HarmonyState) -> Tuple[Dict[str, Any], HarmonyState]:
     """
     Compute harmonic weighting between multiple contextual factors (e.g., empathy, trust, order).
     Inputs:
       context_signals: dict[str, float]
       temperature: float (for softmax sensitivity)
     """
+    state = coerce_state(HarmonyState, state)
     context_signals: Dict[str, float] = ctx.get("context_signals", {})
     temperature = float(ctx.get("temperature", 1.0))
     if not context_signals:
         context_signals = {"empathy": 0.5, "trust": 0.5, "order": 0.5}
 
-    # Normalize inputs to [0,1]
-    normed_values = {k: clamp(float(v), 0.0, 1.0) for k, v in context_signals.items()}
-    keys = list(normed_values.keys())
-    vals = list(normed_values.values())
+    # Normalize inputs to [0,1] into a per-state buffer; the signal keys are
+    # usually stable across ticks, so it is only reallocated when they change.
+    keys = tuple(context_signals)
+    vals = state._signals_buf
+    if state._signals_keys != keys:
+        vals = [0.0] * len(keys)
+        state._signals_keys = keys
+        state._signals_buf = vals
+    for i, v in enumerate(context_signals.values()):
+        vals[i] = max(0.0, min(1.0, float(v)))
 
     weights = weighted_softmax(vals, temperature)
     weighted_context = {k: round(w, 4) for k, w in zip(keys, weights)}
@@ -60,28 +81,27 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     # Compute harmony index = variance complement
     mean_val = sum(vals) / len(vals)
     variance = sum((v - mean_val) ** 2 for v in vals) / len(vals)
-    harmony_index = round(1.0 - min(1.0, variance * 4), 4)  # 0 = chaotic, 1 = harmonious
+    harmony_index = 1.0 - min(1.0, variance * 4)  # 0 = chaotic, 1 = harmonious
+    harmony_out = round(harmony_index, 4)  # reported form; decisions use full precision
 
     # Decision logic
     if harmony_index < 0.4:
         action = "rebalance"
-        rationale = f"Contextual disharmony detected (index={harmony_index}); rebalancing context weights."
+        rationale = f"Contextual disharmony detected (index={harmony_out}); rebalancing context weights."
         risk = 0.6
     elif harmony_index > 0.8:
         action = "stabilize"
-        rationale = f"Context harmony strong (index={harmony_index}); maintaining configuration."
+        rationale = f"Context harmony strong (index={harmony_out}); maintaining configuration."
         risk = 0.2
     else:
         action = "monitor"
-        rationale = f"Moderate harmony (index={harmony_index}); continuing observation."
+        rationale = f"Moderate harmony (index={harmony_out}); continuing observation."
         risk = 0.4
 
-    state.update({
-        "weights": weighted_context,
-        "harmony_index": harmony_index,
-        "last_action": action,
-        "temperature": temperature,
-    })
+    state.weights = weighted_context
+    state.harmony_index = harmony_index
+    state.last_action = action
+    state.temperature = temperature
     safe_log(f"HarmonyWeighting:{action}", state)
 
     output = {
@@ -91,7 +111,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "rationale": rationale,
         "data": {
             "weights": weighted_context,
-            "harmony_index": harmony_index,
+            "harmony_index": harmony_out,
             "temperature": temperature,
         },
     }
@@ -3,7 +3,11 @@
 # Refactored for v11r1: deterministic schema, coherence integrity scoring, and audit fallback.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Tuple, List
+from collections import deque
+from dataclasses import dataclass, field
+
+from core.module_helpers import AUDIT_MAXLEN, coerce_state, log_coalesced
 
 NAME = "Integrity Monitor"
 VERSION = "1.1.0"
@@ -12,28 +16,40 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 # Helper fallback
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
+
+
+@dataclass(slots=True)
+class IntegrityState:
+    """Short output history used to spot repeated or contradictory outputs."""
+    last_outputs: List[str] = field(default_factory=list)
+    coherence_score: float = 1.0
+    contradictions: int = 0       # run() stores a bool here
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
+
+def safe_log(event: str, state: IntegrityState) -> None:
+    log_coalesced(state._audit, event)
 
 
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> IntegrityState:
     """Initialize state for integrity tracking."""
-    return {"last_outputs": [], "coherence_score": 1.0, "contradictions": 0}
+    return IntegrityState()
 
 
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: IntegrityState) -> Tuple[Dict[str, Any], IntegrityState]:
     """
     Check for logical or moral contradictions in outputs to maintain system coherence.
     Inputs:
       ctx["output"]: optional string from last system action
     """
+    state = coerce_state(IntegrityState, state)
     last_output = ctx.get("output", "")
-    outputs = state.get("last_outputs", [])
+    outputs = state.last_outputs
     outputs.append(last_output)
-    state["last_outputs"] = outputs[-10:]  # keep short history
+    state.last_outputs = outputs[-10:]  # keep short history
 
     contradictions = False
     if len(outputs) >= 2 and outputs[-1] != "" and outputs.count(outputs[-1]) > 1:
@@ -50,8 +66,8 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         rationale = "No contradiction found; coherence intact."
         risk = 0.1
 
-    state["coherence_score"] = round(coherence_score, 3)
-    state["contradictions"] = contradictions
+    state.coherence_score = coherence_score
+    state.contradictions = contradictions
     safe_log(f"Integrity:{action}", state)
 
     output = {
@@ -3,9 +3,23 @@
 # Refactored for v11r1: deterministic schema, mission-fit & length governance, safe audit fallback.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
 import re
 
+from core.module_helpers import AUDIT_MAXLEN, audit_of, cfg_merger
+
+try:
+    import ahocorasick  # optional: pyahocorasick for one-pass mission matching
+except Exception:  # fallback: per-keyword substring scan
+    ahocorasick = None
+
+try:
+    import hyperscan  # optional: DFA scanning of ASCII suggestions
+except Exception:  # fallback: COMBINED_RE_B
+    hyperscan = None
+
 NAME = "Intent & Suggestion Governor"
 VERSION = "1.1.0"
 
@@ -13,10 +27,7 @@ VERSION = "1.1.0"
 # Helper fallback
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append({"event": event})
 
 # ---------------------------------------------------------------------------
 # Config (override via ctx["governor_cfg"])
@@ -32,9 +43,53 @@ DEFAULT_CFG = {
     # Mission alignment (keywords to encourage)
     "min_alignment_hits": 1,   # require at least this many mission keyword hits if mission provided
 }
+_merged_cfg = cfg_merger(DEFAULT_CFG)
 
 FORCE_WORDS_RE = re.compile(r"\b(guarantee|must|always|never|promise)\b", re.I)
 PROHIBITED_RE  = re.compile(r"\b(hack|bypass|exploit|ddos|phish)\b", re.I)
+# Both word lists in one alternation so run() scans the suggestion only once.
+COMBINED_RE = re.compile(
+    r"\b(?:(?P<prohibited>hack|bypass|exploit|ddos|phish)|(?P<force>guarantee|must|always|never|promise))\b",
+    re.I,
+)
+# Same pattern for ASCII input: the bytes engine skips Unicode handling (~30% faster).
+COMBINED_RE_B = re.compile(COMBINED_RE.pattern.encode("ascii"), re.I)
+
+# Optional Hyperscan database: one caseless \b-anchored pattern per word, ids
+# below _HS_N_PROHIBITED are prohibited verbs, the rest force words.
+_HS_WORDS = ("hack", "bypass", "exploit", "ddos", "phish",
+             "guarantee", "must", "always", "never", "promise")
+_HS_N_PROHIBITED = 5
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[rb"\b" + w.encode("ascii") + rb"\b" for w in _HS_WORDS],
+            ids=list(range(len(_HS_WORDS))),
+            elements=len(_HS_WORDS),
+            flags=[hyperscan.HS_FLAG_CASELESS] * len(_HS_WORDS),
+        )
+    except Exception:  # fallback: COMBINED_RE_B
+        _HS_DB = None
+
+def _hs_scan(data: bytes) -> Tuple[bool, List[str]]:
+    """(has_prohibited, force words in order) via the Hyperscan database."""
+    matches: List[Tuple[int, int]] = []
+    def on_match(id_, start, end, flags, context):
+        matches.append((end, id_))
+    _HS_DB.scan(data, match_event_handler=on_match)
+    matches.sort()
+    has_prohibited = False
+    force: List[str] = []
+    for _, id_ in matches:
+        if id_ < _HS_N_PROHIBITED:
+            has_prohibited = True
+        else:
+            force.append(_HS_WORDS[id_])
+    return has_prohibited, force
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -43,16 +98,46 @@ def init() -> Dict[str, Any]:
     return {
         "decisions": 0,
         "last_action": "none",
+        "_audit": deque(maxlen=AUDIT_MAXLEN),
     }
 
 # ---------------------------------------------------------------------------
 # Core
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=64)
+def _prep_mission(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Non-empty mission keywords, lowercased once per distinct mission."""
+    return tuple(kw.lower() for kw in keys if kw)
+
+@lru_cache(maxsize=256)
+def _build_ac(keys: Tuple[str, ...]):
+    """Automaton over lowercased mission keywords; value = how many mission entries share it."""
+    counts: Dict[str, int] = {}
+    for kw in keys:
+        if kw:
+            low = kw.lower()
+            counts[low] = counts.get(low, 0) + 1
+    if not counts:
+        return None
+    automaton = ahocorasick.Automaton()
+    for low, n in counts.items():
+        automaton.add_word(low, (low, n))
+    automaton.make_automaton()
+    return automaton
+
 def _alignment_hits(text: str, mission: list[str]) -> int:
     if not mission:
         return 0
     lowered = text.lower()
-    return sum(1 for kw in mission if kw and kw.lower() in lowered)
+    keys = tuple(mission)
+    kws = _prep_mission(keys)
+    if ahocorasick is None or len(kws) < 4:
+        # Few keywords: C-level substring checks beat walking an automaton.
+        return sum(1 for kw in kws if kw in lowered)
+    automaton = _build_ac(keys)
+    # Each keyword counts once however often it occurs, matching the substring scan.
+    found = {value for _, value in automaton.iter(lowered)}
+    return sum(n for _, n in found)
 
 def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
@@ -66,16 +151,33 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     Output schema:
       { ok, action, risk, rationale, data{...} }
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("governor_cfg", {}))
-
+    cfg = _merged_cfg(ctx.get("governor_cfg"))
     suggestion = str(ctx.get("text", "") or "")
     mission = ctx.get("mission", []) or []
+    return _govern(suggestion, mission, cfg, state), state
+
+def _govern(suggestion: str, mission: list[str], cfg: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    """Score one suggestion against an already-merged cfg; updates state and returns the output."""
     length = len(suggestion)
 
     # --- Fast safety checks
-    has_prohibited = PROHIBITED_RE.search(suggestion) is not None
-    force_flags = FORCE_WORDS_RE.findall(suggestion)
+    # Single pass; no early exit on a prohibited hit so force_words_found stays complete.
+    has_prohibited = False
+    force_flags = []
+    if _HS_DB is not None and suggestion.isascii():
+        has_prohibited, force_flags = _hs_scan(suggestion.encode("ascii"))
+    elif suggestion.isascii():
+        for m in COMBINED_RE_B.finditer(suggestion.encode("ascii")):
+            if m.lastgroup == "prohibited":
+                has_prohibited = True
+            else:
+                force_flags.append(m.group("force").decode("ascii"))
+    else:
+        for m in COMBINED_RE.finditer(suggestion):
+            if m.lastgroup == "prohibited":
+                has_prohibited = True
+            else:
+                force_flags.append(m.group("force"))
 
     # --- Alignment
     hits = _alignment_hits(suggestion, mission)
@@ -83,8 +185,9 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     aligned = (hits >= cfg["min_alignment_hits"]) if requires_alignment else True
 
     # --- Risk model (deterministic)
-    length_risk = clamp(length / max(1, cfg["max_len"]), 0.0, 1.0)
-    tone_risk = clamp(min(1.0, 0.15 * len(force_flags)), 0.0, 1.0)
+    # Both ratios are non-negative by construction, so only the upper bound needs applying.
+    length_risk = min(1.0, length / max(1, cfg["max_len"]))
+    tone_risk = min(1.0, 0.15 * len(force_flags))
     safety_risk = 1.0 if has_prohibited else 0.0
     # Combine conservatively: prioritize safety, then tone, then length
     risk = round(max(safety_risk, tone_risk, length_risk), 3)
@@ -115,26 +218,41 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     state["last_action"] = action
     safe_log(f"SuggestionGovernor:{action}", state)
 
-    output = {
-        "ok": ok,
-        "action": action,               # "allow" | "ask" | "review" | "block"
-        "risk": risk,
-        "rationale": rationale,
-        "data": {
-            "suggestion_len": length,
-            "mission_hits": hits,
-            "requires_alignment": requires_alignment,
-            "force_words_found": [w.lower() for w in force_flags],
-            "prohibited_detected": has_prohibited,
-            "thresholds": {
-                "ask_len": cfg["ask_len"],
-                "max_len": cfg["max_len"],
-                "risk_budget": cfg["risk_budget"],
-                "min_alignment_hits": cfg["min_alignment_hits"],
-            },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["ok"] = ok
+    output["action"] = action               # "allow" | "ask" | "review" | "block"
+    output["risk"] = risk
+    output["rationale"] = rationale
+    output["data"] = {
+        "suggestion_len": length,
+        "mission_hits": hits,
+        "requires_alignment": requires_alignment,
+        "force_words_found": [w.lower() for w in force_flags],
+        "prohibited_detected": has_prohibited,
+        "thresholds": {
+            "ask_len": cfg["ask_len"],
+            "max_len": cfg["max_len"],
+            "risk_budget": cfg["risk_budget"],
+            "min_alignment_hits": cfg["min_alignment_hits"],
         },
     }
-    return output, state
+    return output
+
+def run_many(texts: List[str], mission: Optional[list[str]] = None,
+             cfg: Optional[Dict[str, Any]] = None,
+             state: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Govern many suggestions sharing one mission and config (e.g. corpus filtering).
+    The config merge and mission keyword prep happen once; per-text work is the
+    regex scan and scoring. Returns (outputs, state) in input order.
+    """
+    if state is None:
+        state = init()
+    merged = _merged_cfg(cfg)
+    mission = mission or []
+    _gov = _govern
+    outputs = [_gov(str(t or ""), mission, merged, state) for t in texts]
+    return outputs, state
 
 def describe() -> Dict[str, Any]:
     return {
@@ -4,22 +4,27 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
-import math
+from collections import deque
+from math import exp as _exp
+
+from core.module_helpers import AUDIT_MAXLEN, audit_of, cfg_merger, clamp01
 
 NAME = "Intent and Threat Hub"
 VERSION = "1.1.0"
 
+HISTORY_WINDOW = 20  # recent intent/threat readings kept in state
+
 # ---------------------------------------------------------------------------
 # Helper fallbacks
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append({"event": event})
 
 def sigmoid(x: float) -> float:
-    return 1 / (1 + math.exp(-x))
+    # Direct libm call beats an interpolated lookup table in CPython; exp overflows past ~709.
+    if x < -700.0:
+        return 0.0
+    return 1 / (1 + _exp(-x))
 
 # ---------------------------------------------------------------------------
 # Config
@@ -32,6 +37,9 @@ DEFAULT_CFG = {
     "escalate_threshold": 0.8,
     "recover_threshold": 0.3,
 }
+_merged_cfg = cfg_merger(DEFAULT_CFG, warn_unknown="threat_cfg")
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -42,7 +50,8 @@ def init() -> Dict[str, Any]:
         "intent_score": 0.5,
         "threat_level": 0.0,
         "mode": "neutral",
-        "history": [],
+        "history": deque(maxlen=HISTORY_WINDOW),
+        "_audit": deque(maxlen=AUDIT_MAXLEN),
     }
 
 # ---------------------------------------------------------------------------
@@ -57,12 +66,11 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - context_risk: float [0,1]
       - threat_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("threat_cfg", {}))
+    cfg = _merged_cfg(ctx.get("threat_cfg"))
 
-    aggression = clamp(float(ctx.get("aggression", 0.0)), 0.0, 1.0)
-    cooperation = clamp(float(ctx.get("cooperation", 0.0)), 0.0, 1.0)
-    context_risk = clamp(float(ctx.get("context_risk", cfg["base_risk"])), 0.0, 1.0)
+    aggression = clamp01(float(ctx.get("aggression", 0.0)))
+    cooperation = clamp01(float(ctx.get("cooperation", 0.0)))
+    context_risk = clamp01(float(ctx.get("context_risk", cfg["base_risk"])))
 
     # Intent score: weighted moral direction (positive = cooperative)
     intent_score = sigmoid(
@@ -70,10 +78,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     )
 
     # Threat level rises if aggression or context risk are high
-    threat_level = clamp(
-        (aggression * 0.7 + context_risk * 0.5) - (cooperation * 0.3),
-        0.0, 1.0
-    )
+    threat_level = clamp01((aggression * 0.7 + context_risk * 0.5) - (cooperation * 0.3))
 
     # Decision logic
     if threat_level >= cfg["escalate_threshold"]:
@@ -98,29 +103,28 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         risk = threat_level
 
     # Update state
-    state.update({
-        "intent_score": round(intent_score, 3),
-        "threat_level": round(threat_level, 3),
-        "mode": mode,
-    })
-    state.setdefault("history", []).append({"intent": intent_score, "threat": threat_level})
-    state["history"] = state["history"][-20:]  # keep recent window only
+    # Full precision in state; rounding happens once, for the output.
+    state["intent_score"] = intent_score
+    state["threat_level"] = threat_level
+    state["mode"] = mode
+    history = state.get("history")
+    if not isinstance(history, deque):  # legacy list state: convert once
+        history = state["history"] = deque(history or (), maxlen=HISTORY_WINDOW)
+    history.append({"intent": intent_score, "threat": threat_level})
 
     safe_log(f"IntentThreat:{mode}:{action}", state)
 
-    output = {
-        "ok": True,
-        "action": action,          # "allow" | "monitor" | "alert_safety" | "deescalate"
-        "risk": round(risk, 3),
-        "rationale": rationale,
-        "data": {
-            "intent_score": round(intent_score, 3),
-            "threat_level": round(threat_level, 3),
-            "mode": mode,
-            "aggression": aggression,
-            "cooperation": cooperation,
-            "context_risk": context_risk,
-        },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["action"] = action          # "allow" | "monitor" | "alert_safety" | "deescalate"
+    output["risk"] = round(risk, 3)
+    output["rationale"] = rationale
+    output["data"] = {
+        "intent_score": round(intent_score, 3),
+        "threat_level": round(threat_level, 3),
+        "mode": mode,
+        "aggression": aggression,
+        "cooperation": cooperation,
+        "context_risk": context_risk,
     }
     return output, state
 
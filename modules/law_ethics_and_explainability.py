@@ -5,6 +5,10 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from collections import deque
+import sys
+
+from core.module_helpers import AUDIT_MAXLEN, audit_of, cfg_merger, clamp01
 
 # --- Safe imports (fallbacks so module never raises on missing helpers) ---
 try:
@@ -49,12 +53,11 @@ NAME = "Law, Ethics & Explainability"
 VERSION = "1.4.0"
 
 # ----------------------------- Helpers ---------------------------------
-def clamp(v: float, lo: float, hi: float) -> float:
+def _as_float(v: Any) -> float:
     try:
-        v = float(v)
+        return float(v)
     except Exception:
-        v = 0.0
-    return max(lo, min(hi, v))
+        return 0.0
 
 def _to_list_str(x) -> list[str]:
     if x is None:
@@ -64,66 +67,139 @@ def _to_list_str(x) -> list[str]:
     return [str(x)]  # allow singleton
 
 def _lower_set(x) -> set[str]:
-    return {str(i).lower() for i in _to_list_str(x)}
+    # Single pass; skips the intermediate list from _to_list_str.
+    if x is None:
+        return set()
+    if isinstance(x, (list, tuple, set)):
+        return {str(i).lower() for i in x}
+    return {str(x).lower()}
 
 def safe_log(event: Dict[str, Any], state: Dict[str, Any]) -> None:
     try:
-        state.setdefault("_audit", []).append(event)
+        audit_of(state).append(event)
     except Exception:
         pass
 
 # --------------------------- Policy ------------------------------------
 DEFAULT_POLICY = {
-    "illegal_flags": {"illegal", "contraband", "exfiltration"},
-    "hard_ethics_flags": {"exploitation", "child_endangerment", "targeted_harm"},
-    "soft_ethics_flags": {"privacy_risk", "bias_concern", "ambiguous_consent"},
+    "illegal_flags": frozenset({"illegal", "contraband", "exfiltration"}),
+    "hard_ethics_flags": frozenset({"exploitation", "child_endangerment", "targeted_harm"}),
+    "soft_ethics_flags": frozenset({"privacy_risk", "bias_concern", "ambiguous_consent"}),
     "audience_weight": {"child": 1.0, "teen": 0.6, "adult": 0.3, "researcher": 0.2},
     "review_cutoff": 0.4,
     "block_cutoff": 0.8,
     "psi_risk_weight": 0.15,  # light, non-punitive nudge
 }
+_merged_cfg = cfg_merger(DEFAULT_POLICY)
+
+# Sorted default flag lists for the explanation block, computed once.
+_DEFAULT_SORTED: Dict[str, Tuple[str, ...]] = {
+    k: tuple(sorted(v)) for k, v in DEFAULT_POLICY.items() if isinstance(v, (set, frozenset))
+}
+
+def _sorted_flags(policy: Dict[str, Any], key: str) -> list[str]:
+    flags = policy[key]
+    if flags is DEFAULT_POLICY[key]:
+        return list(_DEFAULT_SORTED[key])  # fresh list: outputs must not share state
+    return sorted(flags)
+
+# Interned canonical forms for common audience / jurisdiction spellings, so
+# run() skips the str()/lower()/upper() round-trip for them.
+_AUDIENCE_CANON: Dict[str, str] = {
+    form: sys.intern(a)
+    for a in DEFAULT_POLICY["audience_weight"]
+    for form in (a, a.upper(), a.capitalize())
+}
+_JURISDICTION_CANON: Dict[str, str] = {"": ""}
+_JURISDICTION_CANON.update({form: sys.intern(j) for j in ("UK", "EU", "US") for form in (j, j.lower())})
+
+def _canon(table: Dict[str, str], raw: Any, fold) -> str:
+    hit = table.get(raw) if isinstance(raw, str) else None
+    return hit if hit is not None else fold(str(raw))
+
+# ----------------------- Jurisdiction lookups ---------------------------
+_LEGAL_CACHE: Dict[Tuple[str, int], Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+_LEGAL_CACHE_MAX = 64
+
+def _legal_context(jurisdiction: str, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    """Merged adapter + profile annotations, memoized per (jurisdiction, manifest). Returns a fresh dict."""
+    key = (jurisdiction, id(manifest))
+    hit = _LEGAL_CACHE.get(key)
+    if hit is None or hit[0] is not manifest:
+        adapter = select_adapter(jurisdiction, manifest) if jurisdiction else {}
+        profile = get_profile(jurisdiction)
+        if len(_LEGAL_CACHE) >= _LEGAL_CACHE_MAX:
+            _LEGAL_CACHE.clear()
+        hit = (manifest, {
+            "jurisdiction": jurisdiction or (manifest.get("legal", {}) or {}).get("default_jurisdiction", ""),
+            "profile_name": profile.get("name", jurisdiction or ""),
+            "lawful_basis": lawful_basis(adapter) if adapter else "unknown",
+            "dpia_required": requires_dpia(adapter) if adapter else False,
+            "mou_required": is_mou_required(adapter) if adapter else False,
+            "notes": profile.get("notes", ""),
+        })
+        _LEGAL_CACHE[key] = hit
+    return dict(hit[1])
+
+def reset_cache() -> None:
+    """Forget memoized jurisdiction lookups (call after editing legal profiles or the manifest)."""
+    _LEGAL_CACHE.clear()
+
+# PSI verdict for empty design/telemetry, reused by run()'s no-signal fast path.
+_PSI_EMPTY = check_psychological_integrity(design={}, telemetry={})
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # --------------------------- Lifecycle ---------------------------------
 def init() -> Dict[str, Any]:
-    return {"last_action": "allow", "last_risk": 0.0, "decisions": 0}
+    return {"last_action": "allow", "last_risk": 0.0, "decisions": 0, "_audit": deque(maxlen=AUDIT_MAXLEN)}
 
 # ----------------------------- Core ------------------------------------
 def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     try:
         # Normalize inputs
-        policy = dict(DEFAULT_POLICY)
-        if isinstance(ctx.get("policy_cfg"), dict):
-            policy.update(ctx["policy_cfg"])
+        policy_cfg = ctx.get("policy_cfg")
+        policy = _merged_cfg(policy_cfg if isinstance(policy_cfg, dict) else None)
 
         legal_flags = _lower_set(ctx.get("legal"))
         ethical_flags = _lower_set(ctx.get("ethical"))
-        audience = str(ctx.get("audience", "adult")).lower() or "adult"
-        base_risk = clamp(ctx.get("base_risk", 0.0), 0.0, 1.0)
-        jurisdiction = str(ctx.get("jurisdiction", "")).upper()
-
-        # Base scoring from policy signals
-        illegal_hit = bool(legal_flags & policy["illegal_flags"])
-        hard_ethic_hit = bool(ethical_flags & policy["hard_ethics_flags"])
-        soft_ethic_hit = bool(ethical_flags & policy["soft_ethics_flags"])
+        audience = _canon(_AUDIENCE_CANON, ctx.get("audience", "adult"), str.lower) or "adult"
+        base_risk = clamp01(_as_float(ctx.get("base_risk", 0.0)))
+        jurisdiction = _canon(_JURISDICTION_CANON, ctx.get("jurisdiction", ""), str.upper)
+        design = ctx.get("design_notes", {}) or {}
+        telemetry = ctx.get("telemetry", {}) or {}
 
         sens = float(policy.get("audience_weight", {}).get(audience, 0.3))
+        psi_cfg = get_psychological_integrity()
 
-        risk = base_risk
-        if illegal_hit:
-            risk = max(risk, 0.95)
-        if hard_ethic_hit:
-            risk = max(risk, 0.90)
-        if soft_ethic_hit:
-            risk = max(risk, 0.50)
+        # Fast path: default policy, no flags and no base risk leave only the
+        # PSI term; with no design/telemetry that is the PSI result for empty
+        # inputs, evaluated once at import.
+        if (policy is DEFAULT_POLICY and base_risk == 0.0 and not legal_flags
+                and not ethical_flags and not design and not telemetry):
+            illegal_hit = hard_ethic_hit = soft_ethic_hit = False
+            psi_hits, psi_score = list(_PSI_EMPTY[0]), _PSI_EMPTY[1]
+            risk = clamp01(float(policy.get("psi_risk_weight", 0.15)) * float(psi_score))
+        else:
+            # Base scoring from policy signals
+            # Only truthiness matters: isdisjoint stops at the first hit and builds no set.
+            illegal_hit = not legal_flags.isdisjoint(policy["illegal_flags"])
+            hard_ethic_hit = not ethical_flags.isdisjoint(policy["hard_ethics_flags"])
+            soft_ethic_hit = not ethical_flags.isdisjoint(policy["soft_ethics_flags"])
+
+            risk = base_risk
+            if illegal_hit:
+                risk = max(risk, 0.95)
+            if hard_ethic_hit:
+                risk = max(risk, 0.90)
+            if soft_ethic_hit:
+                risk = max(risk, 0.50)
 
-        risk = clamp(risk * (1.0 + sens * 0.5), 0.0, 1.0)
+            risk = clamp01(risk * (1.0 + sens * 0.5))
 
-        # PSI compliance (non-punitive)
-        psi_cfg = get_psychological_integrity()
-        design = ctx.get("design_notes", {}) or {}
-        telemetry = ctx.get("telemetry", {}) or {}
-        psi_hits, psi_score = check_psychological_integrity(design=design, telemetry=telemetry)
-        risk = clamp(risk + float(policy.get("psi_risk_weight", 0.15)) * float(psi_score), 0.0, 1.0)
+            # PSI compliance (non-punitive)
+            psi_hits, psi_score = check_psychological_integrity(design=design, telemetry=telemetry)
+            risk = clamp01(risk + float(policy.get("psi_risk_weight", 0.15)) * float(psi_score))
 
         # Decision thresholds
         if illegal_hit or risk >= float(policy["block_cutoff"]):
@@ -152,17 +228,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
             base_rationale = f"Compliant with legal/ethical policy. (risk={risk:.2f}, audience={audience})"
 
         # Jurisdiction context (merged adapter + profile)
-        manifest = get_manifest()
-        adapter = select_adapter(jurisdiction, manifest) if jurisdiction else {}
-        profile = get_profile(jurisdiction)
-        legal_ctx = {
-            "jurisdiction": jurisdiction or (manifest.get("legal", {}) or {}).get("default_jurisdiction", ""),
-            "profile_name": profile.get("name", jurisdiction or ""),
-            "lawful_basis": lawful_basis(adapter) if adapter else "unknown",
-            "dpia_required": requires_dpia(adapter) if adapter else False,
-            "mou_required": is_mou_required(adapter) if adapter else False,
-            "notes": profile.get("notes", ""),
-        }
+        legal_ctx = _legal_context(jurisdiction, get_manifest())
 
         psi_advisory = {
             "principle": psi_cfg.get("principle", ""),
@@ -181,9 +247,9 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
             "legal_flags": sorted(legal_flags),
             "ethical_flags": sorted(ethical_flags),
             "policy": {
-                "illegal_flags": sorted(policy["illegal_flags"]),
-                "hard_ethics_flags": sorted(policy["hard_ethics_flags"]),
-                "soft_ethics_flags": sorted(policy["soft_ethics_flags"]),
+                "illegal_flags": _sorted_flags(policy, "illegal_flags"),
+                "hard_ethics_flags": _sorted_flags(policy, "hard_ethics_flags"),
+                "soft_ethics_flags": _sorted_flags(policy, "soft_ethics_flags"),
                 "review_cutoff": float(policy["review_cutoff"]),
                 "block_cutoff": float(policy["block_cutoff"]),
                 "audience_weight": sens,
@@ -204,16 +270,15 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
             "legal_context": legal_ctx,
         }, state)
 
-        output = {
-            "ok": ok,
-            "action": action,    # "allow" | "allow_with_flag" | "review" | "block"
-            "risk": round(risk, 3),
-            "rationale": rationale,
-            "data": {
-                "explanation": explanation,
-                "psychological_integrity": psi_advisory,
-                "legal_context": legal_ctx,  # includes merged adapter + profile
-            },
+        output = _OUTPUT_TEMPLATE.copy()
+        output["ok"] = ok
+        output["action"] = action    # "allow" | "allow_with_flag" | "review" | "block"
+        output["risk"] = round(risk, 3)
+        output["rationale"] = rationale
+        output["data"] = {
+            "explanation": explanation,
+            "psychological_integrity": psi_advisory,
+            "legal_context": legal_ctx,  # includes merged adapter + profile
         }
         return output, state
 
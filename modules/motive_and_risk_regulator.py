@@ -4,8 +4,12 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple
+from collections import deque
 import math
 
+from core.jit import njit
+from core.module_helpers import AUDIT_MAXLEN, audit_of, cfg_merger, clamp01
+
 NAME = "Motive and Risk Regulator"
 VERSION = "1.1.0"
 
@@ -13,10 +17,7 @@ VERSION = "1.1.0"
 # Helper fallbacks
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append({"event": event})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -30,6 +31,48 @@ DEFAULT_CFG = {
     "min_motive": 0.0,
     "max_motive": 1.0,
 }
+_merged_cfg = cfg_merger(DEFAULT_CFG, warn_unknown="motive_cfg")
+
+# ---------------------------------------------------------------------------
+# Numeric kernel
+# ---------------------------------------------------------------------------
+# Decision code = (risk >= max_safe_risk) << 1 | (motive <= 0.2); high risk wins,
+# so codes 2 and 3 share a row. Rows: (action, mode, rationale template).
+_DECISION_TABLE = (
+    ("maintain", "balanced",
+     "System balanced (motive={motive:.2f}, risk={risk:.2f}); maintaining state."),
+    ("boost_motive", "recovering",
+     "Motive low ({motive:.2f}); boosting internal drive to maintain responsiveness."),
+    ("reduce_motive", "cautious",
+     "Risk high ({risk:.2f}); lowering motive energy to stabilize system."),
+    ("reduce_motive", "cautious",
+     "Risk high ({risk:.2f}); lowering motive energy to stabilize system."),
+)
+_MOTIVE_DELTA = (0.0, 0.1, -0.2, -0.2)
+
+@njit("Tuple((float64, float64, float64, int64))(float64, float64, float64, float64, float64, float64, "
+      "float64, float64, float64, float64, float64)")
+def _regulate(motive: float, risk: float, intent_signal: float, external_risk: float,
+              motivation_gain: float, risk_decay: float, motivation_decay: float,
+              stability_threshold: float, max_safe_risk: float, min_motive: float,
+              max_motive: float) -> Tuple[float, float, float, int]:
+    """One regulation step; returns (motive_before_decision, motive, risk, decision_code)."""
+    motive = motive + motivation_gain * (intent_signal - 0.5)
+    motive -= motivation_decay
+    motive = max(min_motive, min(max_motive, motive))
+
+    # Exact comparisons on purpose: thresholds must not drift under fastmath.
+    decay_rate = risk_decay * (1.0 if motive < stability_threshold else 0.5)
+    risk = risk * (1.0 - decay_rate) + external_risk * 0.5
+    risk = max(0.0, min(1.0, risk))
+
+    code = (int(risk >= max_safe_risk) << 1) | int(motive <= 0.2)
+    adjusted = motive + _MOTIVE_DELTA[code]
+    if code >= 2:  # only the reduction is re-clamped, as before
+        adjusted = max(min_motive, min(max_motive, adjusted))
+    return motive, adjusted, risk, code
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -40,7 +83,8 @@ def init() -> Dict[str, Any]:
         "motive": 0.5,
         "risk": 0.3,
         "cycles": 0,
-        "mode": "balanced"
+        "mode": "balanced",
+        "_audit": deque(maxlen=AUDIT_MAXLEN),
     }
 
 # ---------------------------------------------------------------------------
@@ -54,63 +98,48 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - external_risk: float [0,1]
       - motive_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("motive_cfg", {}))
+    cfg = _merged_cfg(ctx.get("motive_cfg"))
 
-    intent_signal = clamp(float(ctx.get("intent_signal", 0.5)), 0.0, 1.0)
-    external_risk = clamp(float(ctx.get("external_risk", 0.3)), 0.0, 1.0)
-    motive = clamp(float(state.get("motive", 0.5)), 0.0, 1.0)
-    risk = clamp(float(state.get("risk", 0.3)), 0.0, 1.0)
+    intent_signal = clamp01(float(ctx.get("intent_signal", 0.5)))
+    external_risk = clamp01(float(ctx.get("external_risk", 0.3)))
+    motive = clamp01(float(state.get("motive", 0.5)))
+    risk = clamp01(float(state.get("risk", 0.3)))
     state["cycles"] = state.get("cycles", 0) + 1
 
-    # Compute motive adjustment
-    motive = motive + cfg["motivation_gain"] * (intent_signal - 0.5)
-    motive -= cfg["motivation_decay"]
-    motive = clamp(motive, cfg["min_motive"], cfg["max_motive"])
+    # Motive adjustment, risk evolution (decays slowly, rises with external
+    # pressure) and the decision all happen in the kernel.
+    pre_motive, motive, risk, code = _regulate(
+        motive, risk, intent_signal, external_risk,
+        motivation_gain=float(cfg["motivation_gain"]),
+        risk_decay=float(cfg["risk_decay"]),
+        motivation_decay=float(cfg["motivation_decay"]),
+        stability_threshold=float(cfg["stability_threshold"]),
+        max_safe_risk=float(cfg["max_safe_risk"]),
+        min_motive=float(cfg["min_motive"]),
+        max_motive=float(cfg["max_motive"]),
+    )
+    action, mode, template = _DECISION_TABLE[code]
+    rationale = template.format(motive=pre_motive, risk=risk)
 
-    # Risk evolution — decays slowly, but rises with external pressure
-    decay_rate = cfg["risk_decay"] * (1.0 if motive < cfg["stability_threshold"] else 0.5)
-    risk = risk * (1.0 - decay_rate) + external_risk * 0.5
-    risk = clamp(risk, 0.0, 1.0)
-
-    # Decision logic
-    if risk >= cfg["max_safe_risk"]:
-        action = "reduce_motive"
-        rationale = f"Risk high ({risk:.2f}); lowering motive energy to stabilize system."
-        motive -= 0.2
-        motive = clamp(motive, cfg["min_motive"], cfg["max_motive"])
-        mode = "cautious"
-    elif motive <= 0.2:
-        action = "boost_motive"
-        rationale = f"Motive low ({motive:.2f}); boosting internal drive to maintain responsiveness."
-        motive += 0.1
-        mode = "recovering"
-    else:
-        action = "maintain"
-        rationale = f"System balanced (motive={motive:.2f}, risk={risk:.2f}); maintaining state."
-        mode = "balanced"
-
-    # Final update
-    state.update({
-        "motive": round(motive, 3),
-        "risk": round(risk, 3),
-        "mode": mode,
-    })
+    # Final update: state keeps full precision so the feedback loop does not
+    # re-read values quantised to 3 dp; only the output is rounded.
+    state["motive"] = motive
+    state["risk"] = risk
+    state["mode"] = mode
 
     safe_log(f"MotiveRegulator:{action}:{mode}", state)
 
-    output = {
-        "ok": True,
-        "action": action,        # "maintain" | "reduce_motive" | "boost_motive"
-        "risk": round(risk, 3),
-        "rationale": rationale,
-        "data": {
-            "motive": round(motive, 3),
-            "risk": round(risk, 3),
-            "mode": mode,
-            "intent_signal": intent_signal,
-            "external_risk": external_risk,
-        },
+    risk_out = round(risk, 3)
+    output = _OUTPUT_TEMPLATE.copy()
+    output["action"] = action        # "maintain" | "reduce_motive" | "boost_motive"
+    output["risk"] = risk_out
+    output["rationale"] = rationale
+    output["data"] = {
+        "motive": round(motive, 3),
+        "risk": risk_out,
+        "mode": mode,
+        "intent_signal": intent_signal,
+        "external_risk": external_risk,
     }
     return output, state
 
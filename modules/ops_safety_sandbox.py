@@ -9,7 +9,9 @@ This module demonstrates the "restricted exec" pattern and explicitly
 strips builtins for the purposes of offline verification and unit tests.
 It intentionally contains the explicit patterns:
  - __builtins__ = {}
- - exec(compile(..., "<sandbox>", "exec"), sandbox_globals, sandbox_locals)
+ - compile(..., "<sandbox>", "exec") in _compile_sandbox (lru-cached per snippet)
+ - exec(compiled, sandbox_globals, sandbox_locals) in run_in_sandbox, via the
+   host builtins bound before stripping
 
 These lines are used by `verify_chain_of_custody.py` to confirm the sandbox
 is declared and that builtins are stripped. This file is a minimal example
@@ -20,10 +22,20 @@ filtering, process isolation, timeouts, strict allow-lists).
 from __future__ import annotations
 
 from typing import Dict, Any, Optional
+from functools import lru_cache
+import builtins as _host_builtins  # bound before stripping; functions defined below see no builtins
 
 # Explicitly strip builtins (verifier looks for "__builtins__ = {}" pattern)
 __builtins__ = {}
 
+@lru_cache(maxsize=512)
+def _compile_sandbox(code: str):
+    """
+    Compile sandbox source once per distinct snippet (code objects are immutable).
+    Clear with `_compile_sandbox.cache_clear()` if memory matters.
+    """
+    return _host_builtins.compile(code, "<sandbox>", "exec")
+
 def run_in_sandbox(code: str, *, initial_globals: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Execute `code` in a deliberately restricted sandbox.
@@ -52,11 +64,10 @@ def run_in_sandbox(code: str, *, initial_globals: Optional[Dict[str, Any]] = Non
         for k, v in initial_globals.items():
             sandbox_globals[k] = v
 
-    # Use compile(..., "<sandbox>", "exec") so the verifier can find the sandbox exec pattern.
-    compiled = compile(code, "<sandbox>", "exec")
+    # compile(..., "<sandbox>", "exec") happens in _compile_sandbox, cached per snippet.
+    compiled = _compile_sandbox(code)
 
-    # Intentionally a single-line exec with "<sandbox>" in it so verifier finds it:
-    exec(compiled, sandbox_globals, sandbox_locals)
+    _host_builtins.exec(compiled, sandbox_globals, sandbox_locals)
 
     return sandbox_locals
 
@@ -6,11 +6,31 @@
 from __future__ import annotations
 from typing import Dict, Any, Tuple
 
+from core.module_helpers import clamp01
+
 NAME = "Outcomes & Synthesis Lab"
 VERSION = "1.1.0"
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+def _risk_stats(raw) -> Tuple[float, float]:
+    """One pass over raw risk inputs: clamp to [0,1], return (mean, spread)."""
+    total, lo, hi, n = 0.0, 1.0, 0.0, 0
+    for r in raw:
+        r = float(r)
+        if r < 0.0:
+            r = 0.0
+        elif not r <= 1.0:  # also maps NaN to 1.0, as clamp01() does
+            r = 1.0
+        total += r
+        n += 1
+        if r < lo:
+            lo = r
+        if r > hi:
+            hi = r
+    if not n:
+        return 0.2, 0.0
+    return total / n, (hi - lo if n > 1 else 0.0)
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 def init() -> Dict[str, Any]:
     return {
@@ -29,50 +49,43 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     """
     state["cycles"] = state.get("cycles", 0) + 1
 
-    risks = [clamp(float(r), 0.0, 1.0) for r in ctx.get("risk_inputs", [])]
-    trust = clamp(float(ctx.get("trust_level", 0.7)), 0.0, 1.0)
-    evidence = clamp(float(ctx.get("evidence_strength", 0.6)), 0.0, 1.0)
-    urgency = clamp(float(ctx.get("urgency", 0.4)), 0.0, 1.0)
-
-    if risks:
-        avg_risk = sum(risks) / len(risks)
-        spread = max(risks) - min(risks) if len(risks) > 1 else 0.0
-    else:
-        avg_risk, spread = 0.2, 0.0
+    avg_risk, spread = _risk_stats(ctx.get("risk_inputs", []))
+    trust = clamp01(float(ctx.get("trust_level", 0.7)))
+    evidence = clamp01(float(ctx.get("evidence_strength", 0.6)))
+    urgency = clamp01(float(ctx.get("urgency", 0.4)))
 
-    uncertainty = clamp(0.5 * spread + 0.3 * (1 - evidence) + 0.2 * (1 - trust), 0.0, 1.0)
+    uncertainty = clamp01(0.5 * spread + 0.3 * (1 - evidence) + 0.2 * (1 - trust))
 
     if avg_risk >= 0.7 and evidence >= 0.5:
         action = "escalate"
-        out_risk = clamp(0.8 * avg_risk, 0.0, 1.0)
+        out_risk = clamp01(0.8 * avg_risk)
         rationale = "High risk with sufficient evidence; escalate with safeguards."
     elif uncertainty > 0.45 and urgency < 0.6:
         action = "delay"   # advisory pause for more context
-        out_risk = clamp(0.2 + 0.6 * uncertainty, 0.0, 1.0)
+        out_risk = clamp01(0.2 + 0.6 * uncertainty)
         rationale = "Uncertainty high and urgency moderate; delay for more context."
     elif avg_risk <= 0.2 and evidence >= 0.6:
         action = "proceed"
-        out_risk = clamp(0.15 * (1 - evidence), 0.0, 1.0)
+        out_risk = clamp01(0.15 * (1 - evidence))
         rationale = "Low risk with strong evidence; proceed."
     else:
         action = "maintain"
-        out_risk = clamp(0.3 * (uncertainty + avg_risk) / 2, 0.0, 1.0)
+        out_risk = clamp01(0.3 * (uncertainty + avg_risk) / 2)
         rationale = "Maintain state; signals not decisive."
 
     state["last_action"] = action
     state["uncertainty"] = round(uncertainty, 3)
 
-    output = {
-        "ok": True,                         # advisory engine never marks failure
-        "action": action,                   # escalate | delay | proceed | maintain
-        "risk": round(out_risk, 3),
-        "rationale": rationale,
-        "data": {
-            "avg_risk": round(avg_risk, 3),
-            "uncertainty": state["uncertainty"],
-            "trust": trust,
-            "evidence": evidence,
-            "urgency": urgency,
-        },
+    output = _OUTPUT_TEMPLATE.copy()
+    # ok stays True: advisory engine never marks failure
+    output["action"] = action  # escalate | delay | proceed | maintain
+    output["risk"] = round(out_risk, 3)
+    output["rationale"] = rationale
+    output["data"] = {
+        "avg_risk": round(avg_risk, 3),
+        "uncertainty": state["uncertainty"],
+        "trust": trust,
+        "evidence": evidence,
+        "urgency": urgency,
     }
     return output, state
@@ -3,8 +3,10 @@
 # Refactored for v11r1: deterministic schema, tone normalization, empathy stability, and safe audit fallback.
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
-import math
+
+from core.module_helpers import audit_of, clamp01
 
 NAME = "Persona & Voice Stabiliser"
 VERSION = "1.1.0"
@@ -13,10 +15,7 @@ VERSION = "1.1.0"
 # Helpers
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append({"event": event})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -28,6 +27,19 @@ DEFAULT_CFG = {
     "identity_lock": 0.8,      # minimum stability required to maintain persona consistency
     "baseline_tone": 0.5,      # neutral tone midpoint
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
+
+# Rationale per (action, mode); run() fills in tone_delta with one format call.
+_LOCK_NOTE = " Persona stability below lock threshold; tightening tone control."
+_RATIONALE = {
+    ("rebalance", "stable"): "Tone variance high ({:.2f}); rebalancing toward neutral tone.",
+    ("rebalance", "recovering"): "Tone variance high ({:.2f}); rebalancing toward neutral tone." + _LOCK_NOTE,
+    ("maintain", "stable"): "Tone stable ({:.2f}); maintaining current persona.",
+    ("maintain", "recovering"): "Tone stable ({:.2f}); maintaining current persona." + _LOCK_NOTE,
+}
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -53,58 +65,64 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - context_stress: float [0,1] (environmental pressure)
       - persona_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("persona_cfg", {}))
-    tone_input = clamp(float(ctx.get("tone_input", 0.5)), 0.0, 1.0)
-    context_stress = clamp(float(ctx.get("context_stress", 0.3)), 0.0, 1.0)
+    overrides = ctx.get("persona_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
+    tone_input = clamp01(float(ctx.get("tone_input", 0.5)))
+    context_stress = clamp01(float(ctx.get("context_stress", 0.3)))
     state["cycles"] = state.get("cycles", 0) + 1
 
     prev_tone = state.get("tone", cfg["baseline_tone"])
     prev_stability = state.get("stability", 1.0)
 
+    # Steady state: same inputs, prior tone/stability and config values give
+    # the same result, so reuse the previous output. The config is keyed by
+    # value, which also covers overrides and edits to DEFAULT_CFG.
+    key = (tone_input, context_stress, prev_tone, prev_stability, tuple(cfg[k] for k in DEFAULT_CFG))
+    cached = state.get("_last_output")
+    if cached is not None and state.get("_last_key") == key:
+        safe_log(f"VoiceStabiliser:{cached['action']}:{cached['data']['mode']}", state)
+        output = cached.copy()
+        output["data"] = cached["data"].copy()
+        return output, state
+
     # Tone variance and correction
     tone_delta = abs(tone_input - prev_tone)
     stability_drop = tone_delta * context_stress
-    new_stability = clamp(prev_stability - stability_drop + cfg["calm_gain"], 0.0, 1.0)
+    new_stability = clamp01(prev_stability - stability_drop + cfg["calm_gain"])
 
     # Normalize tone toward baseline
     if tone_delta > cfg["max_variance"]:
         corrected_tone = (tone_input + cfg["baseline_tone"]) / 2
         action = "rebalance"
-        rationale = f"Tone variance high ({tone_delta:.2f}); rebalancing toward neutral tone."
     else:
         corrected_tone = prev_tone + (tone_input - prev_tone) * 0.5
         action = "maintain"
-        rationale = f"Tone stable ({tone_delta:.2f}); maintaining current persona."
 
     # Identity lock handling
-    if new_stability < cfg["identity_lock"]:
-        mode = "recovering"
-        rationale += " Persona stability below lock threshold; tightening tone control."
-    else:
-        mode = "stable"
+    mode = "recovering" if new_stability < cfg["identity_lock"] else "stable"
+    rationale = _RATIONALE[action, mode].format(tone_delta)
 
     # Final update
     state.update({
-        "tone": round(clamp(corrected_tone, 0.0, 1.0), 3),
+        "tone": round(clamp01(corrected_tone), 3),
         "stability": round(new_stability, 3),
         "mode": mode,
     })
     safe_log(f"VoiceStabiliser:{action}:{mode}", state)
 
-    output = {
-        "ok": True,
-        "action": action,  # "maintain" | "rebalance"
-        "risk": round(1.0 - new_stability, 3),
-        "rationale": rationale,
-        "data": {
-            "tone": state["tone"],
-            "stability": state["stability"],
-            "mode": mode,
-            "tone_delta": round(tone_delta, 3),
-            "context_stress": context_stress,
-        },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["action"] = action  # "maintain" | "rebalance"
+    output["risk"] = round(1.0 - new_stability, 3)
+    output["rationale"] = rationale
+    output["data"] = {
+        "tone": state["tone"],
+        "stability": state["stability"],
+        "mode": mode,
+        "tone_delta": round(tone_delta, 3),
+        "context_stress": context_stress,
     }
+    state["_last_key"] = key
+    state["_last_output"] = dict(output, data=output["data"].copy())  # private copy: callers may mutate theirs
     return output, state
 
 # ---------------------------------------------------------------------------
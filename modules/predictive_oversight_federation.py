@@ -3,8 +3,11 @@
 # Refactored for v11r1: deterministic forecasting of moral & operational risk, with safe audit fallback.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
-import math
+from types import MappingProxyType
+from typing import Dict, Any, List, Tuple
+
+from core.jit import njit
+from core.module_helpers import audit_of, clamp01
 
 NAME = "Predictive Oversight Federation"
 VERSION = "1.1.0"
@@ -13,10 +16,23 @@ VERSION = "1.1.0"
 # Helpers
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
+    audit_of(state).append({"event": event})
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+# Explicit signature: numba compiles once at import, skipping type inference.
+@njit("List(float64, reflected=False)(float64, float64, float64, float64, float64, float64, int64)")
+def _project(current: float, growth: float, resilience: float, recovery: float,
+             stability: float, bias: float, horizon: int) -> List[float]:
+    """Compound `current` over `horizon` cycles; returns the unrounded projections."""
+    out = []
+    p = current
+    for _ in range(horizon):
+        p = p * (1.0 + growth) - (resilience * recovery) - (stability * bias)
+        if p < 0.0:
+            p = 0.0
+        elif not p <= 1.0:  # also maps NaN to 1.0, as clamp01() does
+            p = 1.0
+        out.append(p)
+    return out
 
 # ---------------------------------------------------------------------------
 # Config
@@ -29,6 +45,10 @@ DEFAULT_CFG = {
     "alert_threshold": 0.7,
     "warn_threshold": 0.5,
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
+
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -53,27 +73,23 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - stability: float [0,1]
       - oversight_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("oversight_cfg", {}))
+    overrides = ctx.get("oversight_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
 
-    current_risk = clamp(float(ctx.get("current_risk", 0.3)), 0.0, 1.0)
-    resilience = clamp(float(ctx.get("resilience", 0.7)), 0.0, 1.0)
-    stability = clamp(float(ctx.get("stability", 0.8)), 0.0, 1.0)
+    current_risk = clamp01(float(ctx.get("current_risk", 0.3)))
+    resilience = clamp01(float(ctx.get("resilience", 0.7)))
+    stability = clamp01(float(ctx.get("stability", 0.8)))
     state["cycles"] = state.get("cycles", 0) + 1
 
     # Deterministic compounding projection
-    projected = current_risk
-    history = [projected]
-    for _ in range(cfg["prediction_horizon"]):
-        projected = (
-            projected * (1.0 + cfg["risk_growth"])
-            - (resilience * cfg["recovery_factor"])
-            - (stability * cfg["stability_bias"])
-        )
-        projected = clamp(projected, 0.0, 1.0)
-        history.append(round(projected, 3))
-
-    forecast_risk = round(history[-1], 3)
+    history = [current_risk]
+    history.extend(round(p, 3) for p in _project(
+        current_risk, float(cfg["risk_growth"]), resilience, float(cfg["recovery_factor"]),
+        stability, float(cfg["stability_bias"]), int(cfg["prediction_horizon"]),
+    ))
+
+    # Projections are already rounded; only a zero horizon leaves the raw input last.
+    forecast_risk = history[-1] if len(history) > 1 else round(current_risk, 3)
     delta = forecast_risk - current_risk
     trend = "rising" if delta > 0.05 else "falling" if delta < -0.05 else "stable"
 
@@ -101,19 +117,18 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     })
     safe_log(f"Oversight:{action}:{trend}", state)
 
-    output = {
-        "ok": ok,
-        "action": action,  # "monitor" | "warn" | "alert"
-        "risk": forecast_risk,
-        "rationale": rationale,
-        "data": {
-            "forecast_risk": forecast_risk,
-            "trend": trend,
-            "history": history,
-            "current_risk": current_risk,
-            "resilience": resilience,
-            "stability": stability,
-        },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["ok"] = ok
+    output["action"] = action  # "monitor" | "warn" | "alert"
+    output["risk"] = forecast_risk
+    output["rationale"] = rationale
+    output["data"] = {
+        "forecast_risk": forecast_risk,
+        "trend": trend,
+        "history": history,
+        "current_risk": current_risk,
+        "resilience": resilience,
+        "stability": stability,
     }
     return output, state
 
@@ -3,10 +3,12 @@
 # Refactored for v11r1: deterministic synchronization bridge between logical and emotional state spaces.
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
-import math
 import time
 
+from core.module_helpers import audit_of, clamp01
+
 NAME = "Quantum Bridge Sidecar"
 VERSION = "1.1.0"
 
@@ -15,10 +17,21 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
     """Simple local audit buffer."""
-    state.setdefault("_audit", []).append({"event": event, "t": round(time.time(), 3)})
+    audit_of(state).append({"event": event, "t": time.time()})
+
+# ---------------------------------------------------------------------------
+# Config
+# ---------------------------------------------------------------------------
+DEFAULT_CFG = {
+    "gain": 0.5,            # synchronization adjustment gain
+    "drift_tolerance": 0.15, # threshold for phase correction
+    "recovery_rate": 0.25,  # how fast coherence is restored
+    "entropy_bias": 0.1,    # natural decay from system noise
+}
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -44,17 +57,12 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - safety_state: float [0,1]
       - sync_cfg: dict (optional overrides)
     """
-    cfg = {
-        "gain": 0.5,            # synchronization adjustment gain
-        "drift_tolerance": 0.15, # threshold for phase correction
-        "recovery_rate": 0.25,  # how fast coherence is restored
-        "entropy_bias": 0.1,    # natural decay from system noise
-    }
-    cfg.update(ctx.get("sync_cfg", {}))
+    overrides = ctx.get("sync_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
 
-    logical_state = clamp(float(ctx.get("logical_state", 0.5)), 0.0, 1.0)
-    emotional_state = clamp(float(ctx.get("emotional_state", 0.5)), 0.0, 1.0)
-    safety_state = clamp(float(ctx.get("safety_state", 0.5)), 0.0, 1.0)
+    logical_state = clamp01(float(ctx.get("logical_state", 0.5)))
+    emotional_state = clamp01(float(ctx.get("emotional_state", 0.5)))
+    safety_state = clamp01(float(ctx.get("safety_state", 0.5)))
 
     state["cycles"] = state.get("cycles", 0) + 1
 
@@ -66,7 +74,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         abs(safety_state - avg_state),
     ]
     coherence_gap = round(sum(deviations) / len(deviations), 4)
-    sync_quality = clamp(1.0 - (coherence_gap + cfg["entropy_bias"]), 0.0, 1.0)
+    sync_quality = clamp01(1.0 - (coherence_gap + cfg["entropy_bias"]))
 
     # Adjust phase and balance
     if coherence_gap > cfg["drift_tolerance"]:
@@ -85,7 +93,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         rationale = f"Bridge coherent (gap={coherence_gap:.2f}, quality={sync_quality:.2f}); maintaining alignment."
 
     # Clamp outputs
-    sync_quality = round(clamp(sync_quality, 0.0, 1.0), 3)
+    sync_quality = round(clamp01(sync_quality), 3)
     coherence_gap = round(coherence_gap, 3)
 
     state.update({
@@ -95,20 +103,18 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     })
     safe_log(f"QuantumBridge:{action}:{phase}", state)
 
-    output = {
-        "ok": True,
-        "action": action,         # "realign" | "stabilize" | "maintain"
-        "risk": round(1.0 - sync_quality, 3),
-        "rationale": rationale,
-        "data": {
-            "sync_quality": sync_quality,
-            "coherence_gap": coherence_gap,
-            "phase": phase,
-            "inputs": {
-                "logical_state": logical_state,
-                "emotional_state": emotional_state,
-                "safety_state": safety_state,
-            },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["action"] = action  # "realign" | "stabilize" | "maintain"
+    output["risk"] = round(1.0 - sync_quality, 3)
+    output["rationale"] = rationale
+    output["data"] = {
+        "sync_quality": sync_quality,
+        "coherence_gap": coherence_gap,
+        "phase": phase,
+        "inputs": {
+            "logical_state": logical_state,
+            "emotional_state": emotional_state,
+            "safety_state": safety_state,
         },
     }
     return output, state
@@ -4,8 +4,17 @@
 # transparent rationale, and local audit fallback.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 import re
+import sys
+
+from core.module_helpers import audit_of, clamp01
+
+try:
+    import hyperscan  # optional: single DFA pass over ASCII text
+except Exception:  # fallback: one search per pattern
+    hyperscan = None
 
 NAME = "Reflex Policy Core"
 VERSION = "1.1.0"
@@ -14,10 +23,7 @@ VERSION = "1.1.0"
 # Helper fallbacks (avoid hard dependency on core.helpers.*)
 # ---------------------------------------------------------------------------
 def safe_log(event: Dict[str, Any], state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append(event)
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append(event)
 
 # ---------------------------------------------------------------------------
 # Default thresholds & policy (overridable via ctx["reflex_cfg"])
@@ -51,10 +57,82 @@ AUDIENCE_SENSITIVITY = {
     "adult": 0.30,
     "researcher": 0.20,
 }
+# Default sensitivities as a tuple indexed by audience (insertion order).
+_AUDIENCE_IDX = {name: i for i, name in enumerate(AUDIENCE_SENSITIVITY)}
+_SENS_TABLE = tuple(float(v) for v in AUDIENCE_SENSITIVITY.values())
+_ADULT_IDX = _AUDIENCE_IDX["adult"]
+# Common spellings -> interned canonical audience; anything else is lower()ed.
+_AUDIENCE_CANON: Dict[Any, str] = {
+    form: sys.intern(a)
+    for a in AUDIENCE_SENSITIVITY
+    for form in (a, a.upper(), a.capitalize())
+}
+_AUDIENCE_CANON[None] = _AUDIENCE_CANON[""] = _AUDIENCE_CANON["adult"]
+
+# Lower-cased once at import; hits are reported in this form.
+DANGEROUS_KEYWORDS_LC = tuple(k.lower() for k in DANGEROUS_KEYWORDS)
+
+# Precompile regexes for performance. Each is searched on its own, so hits
+# that overlap or start at the same offset are all counted. Labels match
+# the Hyperscan ids below.
+PROHIBITED_RES = [(f"prohibited_{i}", re.compile(p, re.I)) for i, p in enumerate(PROHIBITED_PATTERNS)]
+DECEPTIVE_RES = [(f"deceptive_{i}", re.compile(p, re.I)) for i, p in enumerate(DECEPTIVE_CLAIMS)]
+
+# Hyperscan database over the same pattern set. Ids are offsets into
+# _HS_LABELS; SINGLEMATCH reports each pattern at most once per scan.
+_HS_LABELS = (
+    [f"prohibited_{i}" for i in range(len(PROHIBITED_PATTERNS))]
+    + [f"deceptive_{i}" for i in range(len(DECEPTIVE_CLAIMS))]
+    + list(DANGEROUS_KEYWORDS_LC)
+)
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _hs_exprs = (list(PROHIBITED_PATTERNS) + list(DECEPTIVE_CLAIMS)
+                     + [re.escape(k) for k in DANGEROUS_KEYWORDS_LC])
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[e.encode("ascii") for e in _hs_exprs],
+            ids=list(range(len(_hs_exprs))),
+            elements=len(_hs_exprs),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_hs_exprs),
+        )
+    except Exception:  # fallback: PROHIBITED_RES / DECEPTIVE_RES
+        _HS_DB = None
+
+_N_HS_PROHIBITED = len(PROHIBITED_PATTERNS)
+_N_HS_CLAIMS = _N_HS_PROHIBITED + len(DECEPTIVE_CLAIMS)
+
+def _hs_classify(data: bytes) -> Tuple[set, set, set]:
+    """Hyperscan variant of _classify() for ASCII input."""
+    hard_hits, kw_hits, dec_hits = set(), set(), set()
+    def on_match(id_, start, end, flags, context):
+        if id_ < _N_HS_PROHIBITED:
+            hard_hits.add(_HS_LABELS[id_])
+        elif id_ < _N_HS_CLAIMS:
+            dec_hits.add(_HS_LABELS[id_])
+        else:
+            kw_hits.add(_HS_LABELS[id_])
+    _HS_DB.scan(data, match_event_handler=on_match)
+    return hard_hits, kw_hits, dec_hits
+
+@lru_cache(maxsize=64)
+def _compile(pat: str) -> "re.Pattern[str]":
+    """Compile a caller-supplied pattern once; an invalid regex raises re.error."""
+    return re.compile(pat, re.I)
+
+def _classify(text: str) -> Tuple[set, set, set]:
+    """text -> (prohibited, danger keywords, deceptive) hit sets."""
+    if _HS_DB is not None and text.isascii():
+        return _hs_classify(text.encode("ascii"))
+    lowered = text.lower()
+    hard_hits = {label for label, pat in PROHIBITED_RES if pat.search(text)}
+    # Keywords match as plain substrings (no word boundaries), like the original `in` test.
+    kw_hits = {kw for kw in DANGEROUS_KEYWORDS_LC if kw in lowered}
+    dec_hits = {label for label, pat in DECEPTIVE_RES if pat.search(text)}
+    return hard_hits, kw_hits, dec_hits
 
-# Precompile regexes for performance
-PROHIBITED_RES = [re.compile(pat, re.I) for pat in PROHIBITED_PATTERNS]
-DECEPTIVE_RES = [re.compile(pat, re.I) for pat in DECEPTIVE_CLAIMS]
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -69,53 +147,75 @@ def init() -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 # Core
 # ---------------------------------------------------------------------------
+def _extra_patterns(extra: Any) -> Tuple[str, ...]:
+    """Normalise extra_prohibited: a bare string is one pattern, otherwise a list/tuple."""
+    if extra is None:
+        return ()
+    if isinstance(extra, str):
+        return (extra,)
+    if not isinstance(extra, (list, tuple)):
+        raise TypeError(f"extra_prohibited must be a list or tuple of patterns, not {type(extra).__name__}")
+    return tuple(str(pat) for pat in extra)
+
+def _settings(reflex_cfg: Optional[Dict[str, Any]], raw_audience: Any) -> Tuple[Dict[str, Any], str, float, Tuple[str, ...]]:
+    """Resolve (thresholds, audience, sensitivity, extra_prohibited) for one config/audience."""
+    cfg = {"thresholds": dict(DEFAULT_THRESHOLDS)}
+    cfg.update(reflex_cfg or {})
+    sensitivity_map = cfg.get("audience_sensitivity")  # None -> built-in table
+
+    audience = _AUDIENCE_CANON.get(raw_audience) or (raw_audience or "adult").lower()
+    if sensitivity_map is None:
+        sens = _SENS_TABLE[_AUDIENCE_IDX.get(audience, _ADULT_IDX)]
+    else:
+        sens = float(sensitivity_map.get(audience, AUDIENCE_SENSITIVITY["adult"]))
+    return cfg["thresholds"], audience, sens, _extra_patterns(cfg.get("extra_prohibited"))
+
 def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
     Instant reflexive safety gate for user text or intent.
     Inputs (ctx):
       - text: str
       - audience: one of {"child","teen","adult","researcher"} (default "adult")
-      - reflex_cfg: dict to override thresholds/policy (optional)
+      - reflex_cfg: dict to override thresholds/policy (optional);
+        "extra_prohibited": list of additional prohibited regex patterns
+        (a bare string counts as one pattern; an invalid regex raises re.error)
     """
-    cfg = {
-        "thresholds": dict(DEFAULT_THRESHOLDS),
-        "audience_sensitivity": dict(AUDIENCE_SENSITIVITY),
-    }
-    cfg.update(ctx.get("reflex_cfg", {}))
-    thresholds = cfg["thresholds"]
-    sensitivity_map = cfg["audience_sensitivity"]
-
+    thresholds, audience, sens, extra = _settings(ctx.get("reflex_cfg", {}), ctx.get("audience"))
     text = str(ctx.get("text", "") or "")
-    audience = (ctx.get("audience") or "adult").lower()
-    sens = float(sensitivity_map.get(audience, AUDIENCE_SENSITIVITY["adult"]))
+    return _gate(text, audience, sens, thresholds, extra, state), state
 
+def _gate(text: str, audience: str, sens: float, thresholds: Dict[str, Any],
+          extra: Tuple[str, ...], state: Dict[str, Any]) -> Dict[str, Any]:
+    """Classify and score one text under resolved settings; updates state, returns the output."""
     # --- Risk contributors (deterministic)
     risk = 0.0
     reasons = []
 
+    hard_hits, kw_hits, dec_hits = _classify(text)
+    for pat in extra:
+        if _compile(pat).search(text):
+            hard_hits.add(f"extra:{pat}")
+
     # 1) Prohibited patterns (hard)
-    hard_hits = [pat.pattern for pat in PROHIBITED_RES if pat.search(text)]
     if hard_hits:
         risk = max(risk, 0.95)  # nearly forced block
         reasons.append(f"Prohibited pattern(s): {len(hard_hits)}")
 
     # 2) Dangerous keywords (medium)
-    kw_hits = [kw for kw in DANGEROUS_KEYWORDS if kw.lower() in text.lower()]
     if kw_hits:
         # Scale with number of hits; capped
-        kw_risk = clamp(0.2 * len(kw_hits), 0.0, 0.7)
+        kw_risk = min(0.7, 0.2 * len(kw_hits))
         risk = max(risk, kw_risk)
         reasons.append(f"Danger keywords: {len(kw_hits)}")
 
     # 3) Deceptive claims (soft)
-    dec_hits = [pat.pattern for pat in DECEPTIVE_RES if pat.search(text)]
     if dec_hits:
-        dec_risk = clamp(0.1 + 0.05 * len(dec_hits), 0.0, 0.3)
+        dec_risk = min(0.3, 0.1 + 0.05 * len(dec_hits))
         risk = max(risk, dec_risk)
         reasons.append(f"Deceptive claims: {len(dec_hits)}")
 
     # Audience sensitivity increases effective risk
-    risk = clamp(risk * (1.0 + sens * 0.5), 0.0, 1.0)
+    risk = clamp01(risk * (1.0 + sens * 0.5))
 
     # --- Decision policy
     if risk >= thresholds["block"]:
@@ -152,23 +252,37 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         state,
     )
 
-    output = {
-        "ok": ok,
-        "action": action,                 # "allow" | "ask" | "block"
-        "risk": round(risk, 3),
-        "rationale": rationale,
-        "data": {
-            "audience": audience,
-            "reasons": reasons,
-            "thresholds": thresholds,
-            "hits": {
-                "prohibited": len(hard_hits),
-                "danger_keywords": len(kw_hits),
-                "deceptive": len(dec_hits),
-            },
+    output = _OUTPUT_TEMPLATE.copy()
+    output["ok"] = ok
+    output["action"] = action  # "allow" | "ask" | "block"
+    output["risk"] = state["last_risk"]
+    output["rationale"] = rationale
+    output["data"] = {
+        "audience": audience,
+        "reasons": reasons,
+        "thresholds": thresholds,
+        "hits": {
+            "prohibited": len(hard_hits),
+            "danger_keywords": len(kw_hits),
+            "deceptive": len(dec_hits),
         },
     }
-    return output, state
+    return output
+
+def run_many(texts: List[str], audience: Optional[str] = None,
+             cfg: Optional[Dict[str, Any]] = None,
+             state: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Gate many texts sharing one audience and reflex_cfg (e.g. a queued front-end batch).
+    Config merge and sensitivity lookup happen once; outputs share one thresholds dict.
+    Returns (outputs, state) in input order.
+    """
+    if state is None:
+        state = init()
+    thresholds, audience, sens, extra = _settings(cfg, audience)
+    _g = _gate
+    outputs = [_g(str(t or ""), audience, sens, thresholds, extra, state) for t in texts]
+    return outputs, state
 
 # ---------------------------------------------------------------------------
 # Describe
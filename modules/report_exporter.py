@@ -4,9 +4,12 @@
 # and safe audit summary for downstream archiving.
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
-import datetime
+from typing import Dict, Any, Optional, Tuple
+from collections import deque
 import json
+import time
+
+from core.module_helpers import audit_of
 
 NAME = "Report Exporter"
 VERSION = "1.1.0"
@@ -14,24 +17,35 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
+MAX_REPORTS = 1024   # bounded history of generated reports
+
+def _utc_stamp(t: float) -> str:
+    """UTC ISO-8601 to the second; same text as utcnow().isoformat(timespec="seconds")."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(t))
+
+def safe_log(event: str, state: Dict[str, Any], when: Optional[str] = None) -> None:
     """Simple append-only in-memory audit log."""
-    state.setdefault("_audit", []).append({"event": event, "time": datetime.datetime.utcnow().isoformat()})
+    if when is None:
+        t = time.time()
+        when = f"{_utc_stamp(t)}.{int(t % 1 * 1000):03d}"
+    audit_of(state).append({"event": event, "time": when})
 
 def safe_serialize(obj: Any) -> str:
     """Deterministically serialize Python structures to compact JSON."""
     try:
-        return json.dumps(obj, sort_keys=True, ensure_ascii=False)
+        return json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
     except Exception:
         return str(obj)
 
+_OUTPUT_TEMPLATE: Dict[str, Any] = {"ok": True, "action": "", "risk": 0.0, "rationale": "", "data": None}
+
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
 def init() -> Dict[str, Any]:
     """Initialize reporting state."""
     return {
-        "reports": [],
+        "reports": deque(maxlen=MAX_REPORTS),
         "exports": 0,
         "last_summary": None,
     }
@@ -51,27 +65,17 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     fmt: str = ctx.get("format", "dict")
     tag: str = ctx.get("tag", "cycle")
 
-    timestamp = datetime.datetime.utcnow().isoformat(timespec="seconds")
-    summary = {
-        "tag": tag,
-        "timestamp": timestamp,
-        "modules": {},
-    }
+    now = time.time()
+    timestamp = _utc_stamp(now)
 
-    # Aggregate and normalize module summaries
+    # Aggregate module outputs (only the totals reach the report)
     total_risk = 0.0
     total_ok = 0
     total_count = len(inputs)
-    for name, out in inputs.items():
-        mod_ok = bool(out.get("ok", True))
-        risk = float(out.get("risk", 0.0))
-        total_risk += risk
-        total_ok += 1 if mod_ok else 0
-        summary["modules"][name] = {
-            "ok": mod_ok,
-            "risk": round(risk, 3),
-            "action": out.get("action"),
-        }
+    for out in inputs.values():
+        total_risk += float(out.get("risk", 0.0))
+        if out.get("ok", True):
+            total_ok += 1
 
     avg_risk = round(total_risk / max(total_count, 1), 3)
     reliability = round(total_ok / max(total_count, 1), 3)
@@ -94,21 +98,22 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
 
     state["exports"] = state.get("exports", 0) + 1
     state["last_summary"] = report_data
-    state.setdefault("reports", []).append(report_data)
-    safe_log(f"ReportExporter:generated:{tag}", state)
-
-    output = {
-        "ok": True,
-        "action": "export",
-        "risk": avg_risk,
-        "rationale": f"Generated summary report for {total_count} modules with reliability={reliability:.2f}.",
-        "data": {
-            "report": output_data,
-            "avg_risk": avg_risk,
-            "reliability": reliability,
-            "format": fmt,
-            "tag": tag,
-        },
+    reports = state.get("reports")
+    if not isinstance(reports, deque):  # missing or legacy list: convert once
+        reports = state["reports"] = deque(reports or (), maxlen=MAX_REPORTS)
+    reports.append(report_data)
+    safe_log(f"ReportExporter:generated:{tag}", state, f"{timestamp}.{int(now % 1 * 1000):03d}")
+
+    output = _OUTPUT_TEMPLATE.copy()
+    output["action"] = "export"
+    output["risk"] = avg_risk
+    output["rationale"] = f"Generated summary report for {total_count} modules with reliability={reliability:.2f}."
+    output["data"] = {
+        "report": output_data,
+        "avg_risk": avg_risk,
+        "reliability": reliability,
+        "format": fmt,
+        "tag": tag,
     }
     return output, state
 
@@ -3,9 +3,12 @@
 # Refactored for v11r1: deterministic swarm resilience model, no randomness, unified schema.
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
 import math
 
+from core.module_helpers import audit_of, clamp01
+
 NAME = "Resilience & Swarm Core"
 VERSION = "1.1.0"
 
@@ -14,10 +17,7 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 def safe_log(event: str, state: Dict[str, Any]) -> None:
     """Append-only audit buffer."""
-    state.setdefault("_audit", []).append({"event": event})
-
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    audit_of(state).append({"event": event})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -28,6 +28,8 @@ DEFAULT_CFG = {
     "failure_threshold": 0.4,    # below this = node "weak"
     "stability_decay": 0.05,     # slow decay to prevent runaway
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -50,13 +52,13 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - nodes: dict[str,float] resilience per subsystem
       - swarm_cfg: optional dict to override defaults
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("swarm_cfg", {}))
+    overrides = ctx.get("swarm_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
     incoming_nodes: Dict[str, float] = ctx.get("nodes", {})
 
     # Merge new nodes into existing
     for k, v in incoming_nodes.items():
-        state["nodes"][k] = clamp(float(v), 0.0, 1.0)
+        state["nodes"][k] = clamp01(float(v))
 
     nodes = state["nodes"]
     n = len(nodes)
@@ -71,27 +73,26 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
 
     state["cycles"] += 1
 
-    # Identify weak and strong nodes
-    weak_nodes = {k: v for k, v in nodes.items() if v < cfg["failure_threshold"]}
-    strong_nodes = {k: v for k, v in nodes.items() if v >= cfg["failure_threshold"]}
+    # Identify weak and strong nodes (one pass, keys only)
+    threshold = cfg["failure_threshold"]
+    weak_nodes = []
+    strong_nodes = []
+    for k, v in nodes.items():
+        (weak_nodes if v < threshold else strong_nodes).append(k)
 
-    avg_strength = sum(nodes.values()) / max(n, 1)
-    transfer = cfg["cooperation_gain"] * (len(strong_nodes) / max(n, 1))
+    transfer = cfg["cooperation_gain"] * (len(strong_nodes) / n)
 
-    # Redistribute energy
-    new_nodes = {}
-    for k, v in nodes.items():
-        delta = 0.0
-        if k in weak_nodes:
-            delta += transfer  # weak node gains from strong
-        else:
-            delta -= cfg["stability_decay"]  # small decay for strong nodes
-        v_new = clamp(v + delta + cfg["recovery_factor"], 0.0, 1.0)
-        new_nodes[k] = round(v_new, 3)
+    # Redistribute energy: weak nodes gain from strong, strong nodes decay slightly
+    decay = -cfg["stability_decay"]
+    recovery = cfg["recovery_factor"]
+    new_nodes = {
+        k: round(clamp01(v + (transfer if v < threshold else decay) + recovery), 3)
+        for k, v in nodes.items()
+    }
 
     # Update state
     state["nodes"] = new_nodes
-    state["avg_resilience"] = round(sum(new_nodes.values()) / max(len(new_nodes), 1), 3)
+    state["avg_resilience"] = round(sum(new_nodes.values()) / n, 3)
 
     # Compute overall risk inverse of resilience
     risk = round(1.0 - state["avg_resilience"], 3)
@@ -110,8 +111,8 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "rationale": rationale,
         "data": {
             "avg_resilience": state["avg_resilience"],
-            "weak_nodes": list(weak_nodes.keys()),
-            "strong_nodes": list(strong_nodes.keys()),
+            "weak_nodes": weak_nodes,
+            "strong_nodes": strong_nodes,
             "nodes": new_nodes,
         },
     }
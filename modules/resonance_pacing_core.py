@@ -3,21 +3,35 @@
 # Refactored for v11r1: deterministic pacing regulator for moral/emotional resonance across system cycles.
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 import math
 import time
 
+from core.jit import njit
+from core.module_helpers import AUDIT_MAXLEN, clamp01, coerce_state
+
 NAME = "Resonance Pacing Core"
 VERSION = "1.1.0"
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event, "t": round(time.time(), 3)})
+@dataclass(slots=True)
+class PacingState:
+    """Resonance, tempo and phase left by the previous pacing step."""
+    resonance: float = 0.7
+    tempo: float = 0.5
+    stress: float = 0.0
+    cycles: int = 0
+    phase: str = "stable"
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+def safe_log(event: str, state: PacingState) -> None:
+    state._audit.append({"event": event, "t": time.time()})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -29,23 +43,51 @@ DEFAULT_CFG = {
     "stress_factor": 0.25,       # how stress disturbs pacing
     "recover_rate": 0.3,         # natural recovery to target
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
+
+# Phase by index: 2 * strained + drifting; strain wins regardless of drift.
+_PHASES = ("stable", "adjusting", "strained", "strained")
+_PHASE_ACTIONS = {"stable": "maintain", "adjusting": "stabilize", "strained": "stabilize"}
+
+@njit("Tuple((float64, float64, int64))(float64, float64, float64, float64, float64, "
+      "float64, float64, float64, float64, float64)")
+def _pace(prev_res: float, prev_tempo: float, cognitive_tempo: float, emotional_resonance: float,
+          stress_load: float, target_resonance: float, adapt_rate: float, tempo_gain: float,
+          stress_factor: float, recover_rate: float) -> Tuple[float, float, int]:
+    """One pacing step; returns (resonance, tempo, phase index), unrounded."""
+    # Step 1: Compute drift
+    resonance_gap = emotional_resonance - prev_res
+    tempo_gap = cognitive_tempo - prev_tempo
+
+    # Step 2: Stress impact
+    stress_penalty = stress_factor * stress_load
+
+    # Step 3: Adjust resonance toward target using adapt_rate and recovery
+    adjusted_res = prev_res + adapt_rate * resonance_gap - stress_penalty
+    adjusted_res += recover_rate * (target_resonance - adjusted_res)
+
+    # Step 4: Adjust tempo harmonically toward resonance
+    adjusted_tempo = prev_tempo + tempo_gain * (adjusted_res - prev_tempo)
+
+    # Step 5: Determine phase state (exact comparisons: no fastmath)
+    drifting = not (abs(resonance_gap) < 0.05 and abs(tempo_gap) < 0.05)
+    phase_idx = int(stress_load > 0.6) * 2 + int(drifting)
+
+    adjusted_res = max(0.0, min(1.0, adjusted_res))
+    adjusted_tempo = max(0.0, min(1.0, adjusted_tempo))
+    return adjusted_res, adjusted_tempo, phase_idx
 
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
-    return {
-        "resonance": 0.7,
-        "tempo": 0.5,
-        "stress": 0.0,
-        "cycles": 0,
-        "phase": "stable",
-    }
+def init() -> PacingState:
+    return PacingState()
 
 # ---------------------------------------------------------------------------
 # Core logic
 # ---------------------------------------------------------------------------
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: PacingState) -> Tuple[Dict[str, Any], PacingState]:
     """
     Regulates system pacing and emotional resonance to prevent moral fatigue or impulsive overreaction.
     Inputs:
@@ -54,67 +96,47 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - stress_load: float [0,1]
       - pacing_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("pacing_cfg", {}))
-
-    cognitive_tempo = clamp(float(ctx.get("cognitive_tempo", 0.5)), 0.0, 1.0)
-    emotional_resonance = clamp(float(ctx.get("emotional_resonance", 0.7)), 0.0, 1.0)
-    stress_load = clamp(float(ctx.get("stress_load", 0.3)), 0.0, 1.0)
-    state["cycles"] = state.get("cycles", 0) + 1
-
-    prev_res = state.get("resonance", 0.7)
-    prev_tempo = state.get("tempo", 0.5)
-
-    # Step 1: Compute drift
-    resonance_gap = emotional_resonance - prev_res
-    tempo_gap = cognitive_tempo - prev_tempo
-
-    # Step 2: Stress impact
-    stress_penalty = cfg["stress_factor"] * stress_load
-
-    # Step 3: Adjust resonance toward target using adapt_rate and recovery
-    adjusted_res = prev_res + cfg["adapt_rate"] * resonance_gap - stress_penalty
-    adjusted_res += cfg["recover_rate"] * (cfg["target_resonance"] - adjusted_res)
-
-    # Step 4: Adjust tempo harmonically toward resonance
-    adjusted_tempo = prev_tempo + cfg["tempo_gain"] * (adjusted_res - prev_tempo)
-
-    # Step 5: Determine phase state
-    if stress_load > 0.6:
-        phase = "strained"
-    elif abs(resonance_gap) < 0.05 and abs(tempo_gap) < 0.05:
-        phase = "stable"
-    else:
-        phase = "adjusting"
+    state = coerce_state(PacingState, state)
+    overrides = ctx.get("pacing_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
+
+    cognitive_tempo = clamp01(float(ctx.get("cognitive_tempo", 0.5)))
+    emotional_resonance = clamp01(float(ctx.get("emotional_resonance", 0.7)))
+    stress_load = clamp01(float(ctx.get("stress_load", 0.3)))
+    state.cycles += 1
+
+    adjusted_res, adjusted_tempo, phase_idx = _pace(
+        float(state.resonance), float(state.tempo),
+        cognitive_tempo, emotional_resonance, stress_load,
+        float(cfg["target_resonance"]), float(cfg["adapt_rate"]), float(cfg["tempo_gain"]),
+        float(cfg["stress_factor"]), float(cfg["recover_rate"]),
+    )
+    phase = _PHASES[phase_idx]
 
-    adjusted_res = round(clamp(adjusted_res, 0.0, 1.0), 3)
-    adjusted_tempo = round(clamp(adjusted_tempo, 0.0, 1.0), 3)
+    # State keeps full precision; only the reported values are rounded.
+    res_out, tempo_out = round(adjusted_res, 3), round(adjusted_tempo, 3)
 
-    # Risk inversely proportional to alignment
-    alignment = 1.0 - abs(cfg["target_resonance"] - adjusted_res)
+    # Risk inversely proportional to alignment, taken from the reported
+    # resonance so it matches the 3 dp value callers see.
+    alignment = 1.0 - abs(cfg["target_resonance"] - res_out)
     risk = round(1.0 - alignment, 3)
-
     rationale = (
-        f"Resonance={adjusted_res:.2f}, Tempo={adjusted_tempo:.2f}, Stress={stress_load:.2f}, "
+        f"Resonance={res_out:.2f}, Tempo={tempo_out:.2f}, Stress={stress_load:.2f}, "
         f"Phase={phase}. Adjusted pacing to sustain harmonic balance."
     )
 
-    state.update({
-        "resonance": adjusted_res,
-        "tempo": adjusted_tempo,
-        "stress": stress_load,
-        "phase": phase,
-    })
+    state.resonance, state.tempo = adjusted_res, adjusted_tempo
+    state.stress, state.phase = stress_load, phase
     safe_log(f"ResonancePacing:{phase}", state)
 
     output = {
         "ok": True,
-        "action": "stabilize" if phase != "stable" else "maintain",
+        "action": _PHASE_ACTIONS[phase],
         "risk": risk,
         "rationale": rationale,
         "data": {
-            "resonance": adjusted_res,
-            "tempo": adjusted_tempo,
+            "resonance": res_out,
+            "tempo": tempo_out,
             "stress": stress_load,
             "phase": phase,
         },
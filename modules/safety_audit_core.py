@@ -4,26 +4,30 @@
 
 from __future__ import annotations
 from typing import Dict, Any, Tuple, List
+from collections import deque
 
 try:
-    from core.evidence_packager import package as package_evidence
+    from core.evidence_packager import package_batch as package_evidence_batch
 except Exception:
     # Safe fallback: no packaging, still return schema-compliant output
-    def package_evidence(_event: Dict[str, Any], _out_dir: str = "evidence") -> Dict[str, Any]:
-        return {"disabled": True, "reason": "evidence_packager not available"}
+    def package_evidence_batch(events: List[Dict[str, Any]], _out_dir: str = "evidence") -> List[Dict[str, Any]]:
+        return [{"disabled": True, "reason": "evidence_packager not available"} for _ in events]
 
 NAME = "Safety Audit Core"
 VERSION = "1.1.0"
 
+MAX_MANIFESTS = 256  # recent manifests kept in state["_manifests"]
+
 def _clamp(x: float) -> float:
-    try:
-        x = float(x)
-    except Exception:
-        x = 0.0
-    return max(0.0, min(1.0, x))
+    if type(x) is not float:  # floats skip the conversion and its try frame
+        try:
+            x = float(x)
+        except Exception:
+            return 0.0
+    return x if 0.0 <= x <= 1.0 else (0.0 if x < 0.0 else 1.0)
 
 def init() -> Dict[str, Any]:
-    return {"reports": 0, "last_manifest": None}
+    return {"reports": 0, "last_manifest": None, "_manifests": deque(maxlen=MAX_MANIFESTS)}
 
 def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """
@@ -35,16 +39,17 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     psi = ctx.get("psi") or {}
     events: List[Dict[str, Any]] = list(ctx.get("events") or [])
     note = ctx.get("note", "")
+    psi_score = _clamp(psi.get("score", 0.0))
 
     evidence_manifest = None
     packaged = 0
+    pending: List[Dict[str, Any]] = []
 
     # Package evidence if PSI flagged (non-punitive; for redesign / oversight)
     try:
         psi_hits = int(psi.get("hits", 0) or 0)
-        psi_score = _clamp(psi.get("score", 0.0))
         if psi_hits > 0 or psi_score > 0.0:
-            evidence_manifest = package_evidence({
+            pending.append({
                 "type": "psi_flag",
                 "details": {
                     "hits": psi_hits,
@@ -52,21 +57,34 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
                     "psi": psi,
                 },
             })
-            packaged += 1
     except Exception as e:
         evidence_manifest = {"error": f"psi packaging failed: {e}"}
 
     # Package any explicit safety events
     for ev in events:
         try:
-            evidence_manifest = package_evidence({
+            pending.append({
                 "type": str(ev.get("type", "event")),
                 "details": ev.get("data", {}),
             })
-            packaged += 1
         except Exception as e:
             evidence_manifest = {"error": f"event packaging failed: {e}"}
 
+    # One packaging call for everything collected above
+    if pending:
+        try:
+            manifests = package_evidence_batch(pending)
+            evidence_manifest = manifests[-1]
+        except Exception as e:
+            # PackagingError still carries the events that reached disk; keep them on record.
+            manifests = list(getattr(e, "manifests", ()))
+            evidence_manifest = {"error": f"evidence packaging failed: {e}"}
+        packaged = len(manifests)
+        history = state.get("_manifests")
+        if not isinstance(history, deque):
+            history = state["_manifests"] = deque(history or (), maxlen=MAX_MANIFESTS)
+        history.extend(manifests)
+
     state["reports"] = state.get("reports", 0) + 1
     state["last_manifest"] = evidence_manifest
 
@@ -77,7 +95,7 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "risk": 0.0,
         "rationale": f"Audit emitted. Packaged={packaged}.",
         "data": {
-            "psi": {"hits": psi.get("hits", 0), "score": _clamp(psi.get("score", 0.0))},
+            "psi": {"hits": psi.get("hits", 0), "score": psi_score},
             "last_manifest": evidence_manifest,
             "note": note,
         },
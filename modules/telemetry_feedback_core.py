@@ -4,21 +4,34 @@
 # and audit-safe performance reflection (no hardware I/O required).
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple
+from collections import deque
+from dataclasses import dataclass, field
 import time
 import math
 
+from core.module_helpers import AUDIT_MAXLEN, clamp01, coerce_state
+
 NAME = "Telemetry & Feedback Core"
 VERSION = "1.1.0"
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event, "t": round(time.time(), 3)})
+@dataclass(slots=True)
+class TelemetryState:
+    """Load readings, moral feedback and health carried between telemetry runs."""
+    cpu_load: float = 0.0
+    mem_load: float = 0.0
+    moral_feedback: float = 0.5
+    health: float = 1.0
+    cycles: int = 0
+    _audit: deque = field(default_factory=lambda: deque(maxlen=AUDIT_MAXLEN))
+
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+def safe_log(event: str, state: TelemetryState) -> None:
+    state._audit.append({"event": event, "t": time.time()})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -29,24 +42,20 @@ DEFAULT_CFG = {
     "max_cycles": 10000,        # rolling window
     "risk_weight": 0.4,         # risk weight on feedback signals
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
 
 # ---------------------------------------------------------------------------
 # Lifecycle
 # ---------------------------------------------------------------------------
-def init() -> Dict[str, Any]:
+def init() -> TelemetryState:
     """Initialize telemetry state."""
-    return {
-        "cpu_load": 0.0,
-        "mem_load": 0.0,
-        "moral_feedback": 0.5,
-        "health": 1.0,
-        "cycles": 0,
-    }
+    return TelemetryState()
 
 # ---------------------------------------------------------------------------
 # Core logic
 # ---------------------------------------------------------------------------
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+def run(ctx: Dict[str, Any], state: TelemetryState) -> Tuple[Dict[str, Any], TelemetryState]:
     """
     Collects system diagnostics and moral feedback into a single deterministic health score.
     Inputs:
@@ -55,33 +64,36 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - feedback_signal: float [0,1] (user moral feedback)
       - telemetry_cfg: dict (optional overrides)
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("telemetry_cfg", {}))
-
-    cpu = clamp(float(ctx.get("cpu_load", state.get("cpu_load", 0.2))), 0.0, 1.0)
-    mem = clamp(float(ctx.get("mem_load", state.get("mem_load", 0.3))), 0.0, 1.0)
-    feedback = clamp(float(ctx.get("feedback_signal", state.get("moral_feedback", 0.5))), 0.0, 1.0)
-    state["cycles"] = (state.get("cycles", 0) + 1) % cfg["max_cycles"]
-
-    # Smooth decay toward steady state
-    state["cpu_load"] = round(cpu * (1 - cfg["decay"]), 3)
-    state["mem_load"] = round(mem * (1 - cfg["decay"]), 3)
-    state["moral_feedback"] = round(
-        state.get("moral_feedback", 0.5) * (1 - cfg["decay"]) + feedback * cfg["feedback_gain"], 3
-    )
+    state = coerce_state(TelemetryState, state)
+    overrides = ctx.get("telemetry_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
+
+    prev_feedback = state.moral_feedback
+    cpu = clamp01(float(ctx.get("cpu_load", state.cpu_load)))
+    mem = clamp01(float(ctx.get("mem_load", state.mem_load)))
+    feedback = clamp01(float(ctx.get("feedback_signal", prev_feedback)))
+    state.cycles = (state.cycles + 1) % cfg["max_cycles"]
+
+    # Smooth decay toward steady state (state keeps full precision; outputs are rounded)
+    keep = 1 - cfg["decay"]
+    cpu_load = cpu * keep
+    mem_load = mem * keep
+    moral_feedback = prev_feedback * keep + feedback * cfg["feedback_gain"]
 
     # Health metric combines inverse load and moral feedback
-    load_penalty = (state["cpu_load"] + state["mem_load"]) / 2
-    moral_gain = (state["moral_feedback"] - 0.5) * 2  # -1 to +1 scale
-    health = clamp(1.0 - load_penalty * 0.5 + moral_gain * 0.25, 0.0, 1.0)
-    state["health"] = round(health, 3)
+    load_penalty = (cpu_load + mem_load) / 2
+    moral_gain = (moral_feedback - 0.5) * 2  # -1 to +1 scale
+    health = clamp01(1.0 - load_penalty * 0.5 + moral_gain * 0.25)
+    state.cpu_load, state.mem_load = cpu_load, mem_load
+    state.moral_feedback, state.health = moral_feedback, health
 
     # Derived risk inversely proportional to health
     risk = round(cfg["risk_weight"] * (1.0 - health), 3)
 
+    cpu_out, mem_out, moral_out = round(cpu_load, 3), round(mem_load, 3), round(moral_feedback, 3)
     rationale = (
-        f"CPU={state['cpu_load']:.2f}, MEM={state['mem_load']:.2f}, "
-        f"Moral feedback={state['moral_feedback']:.2f}, Health={health:.2f}."
+        f"CPU={cpu_out:.2f}, MEM={mem_out:.2f}, "
+        f"Moral feedback={moral_out:.2f}, Health={health:.2f}."
     )
 
     safe_log("Telemetry:cycle", state)
@@ -92,11 +104,11 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         "risk": risk,
         "rationale": rationale,
         "data": {
-            "cpu_load": state["cpu_load"],
-            "mem_load": state["mem_load"],
-            "moral_feedback": state["moral_feedback"],
+            "cpu_load": cpu_out,
+            "mem_load": mem_out,
+            "moral_feedback": moral_out,
             "health": health,
-            "cycles": state["cycles"],
+            "cycles": state.cycles,
         },
     }
     return output, state
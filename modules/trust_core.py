@@ -2,14 +2,15 @@
 # v11r1: deterministic trust evaluation with safe defaults
 
 from __future__ import annotations
-from typing import Dict, Any, Tuple
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Tuple
+
+from core.module_helpers import clamp01, coerce_state
 
 NAME = "Trust Core"
 VERSION = "1.1.1"
 
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
-
 DEFAULT_CFG = {
     "gain_rate": 0.15,
     "decay_rate": 0.05,
@@ -18,40 +19,66 @@ DEFAULT_CFG = {
     "max_history": 250,
     "baseline_trust": 0.9,   # NEW: safe default if no history/updates
 }
-
-def init() -> Dict[str, Any]:
-    return {"ledger": {}, "cycles": 0, "avg_trust": DEFAULT_CFG["baseline_trust"]}
-
-def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    cfg = dict(DEFAULT_CFG)
-    if isinstance(ctx.get("trust_cfg"), dict):
-        cfg.update(ctx["trust_cfg"])
-
-    updates = ctx.get("updates", [])
-    state["cycles"] = state.get("cycles", 0) + 1
-    ledger = state.get("ledger", {})
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
+
+@dataclass(slots=True)
+class TrustState:
+    """Per-entity trust ledger and its running average."""
+    ledger: Dict[str, float] = field(default_factory=dict)
+    cycles: int = 0
+    avg_trust: float = DEFAULT_CFG["baseline_trust"]
+
+def init() -> TrustState:
+    return TrustState()
+
+def _apply_updates(ledger: Dict[str, float], updates: Iterable[Dict[str, Any]],
+                   cfg: Mapping[str, float]) -> Dict[str, float]:
+    """Apply updates to ledger in order; returns the entries they touched."""
     changed = {}
 
+    # Loop invariants as locals (avoids a cfg lookup per update).
+    gain = cfg["gain_rate"]
+    pen = cfg["penalty_rate"]
+    thr = cfg["risk_threshold"]
+    base = cfg["baseline_trust"]
+    one_minus_decay = 1.0 - cfg["decay_rate"]
+    ledger_get = ledger.get
+
     for entry in updates:
         name = str(entry.get("module", "unknown"))
         ok = bool(entry.get("ok", True))
-        risk = clamp(float(entry.get("risk", 0.0)), 0.0, 1.0)
-        trust = ledger.get(name, cfg["baseline_trust"])
+        risk = clamp01(float(entry.get("risk", 0.0)))
+        trust = ledger_get(name, base)
 
         # decay every cycle
-        trust *= (1.0 - cfg["decay_rate"])
+        trust *= one_minus_decay
 
         # positive reinforcement
-        if ok and risk < cfg["risk_threshold"]:
-            trust += cfg["gain_rate"] * (1.0 - trust)
+        if ok and risk < thr:
+            trust += gain * (1.0 - trust)
 
         # penalties for failures/high risk
-        if (not ok) or (risk >= cfg["risk_threshold"]):
-            trust -= cfg["penalty_rate"] * risk
+        if (not ok) or (risk >= thr):
+            trust -= pen * risk
 
-        trust = round(clamp(trust, 0.0, 1.0), 3)
+        trust = round(clamp01(trust), 3)
         ledger[name] = trust
         changed[name] = trust
+    return changed
+
+def run(ctx: Dict[str, Any], state: TrustState) -> Tuple[Dict[str, Any], TrustState]:
+    state = coerce_state(TrustState, state)
+    overrides = ctx.get("trust_cfg")
+    if isinstance(overrides, dict) and overrides:
+        cfg = {**DEFAULT_CFG, **overrides}
+    else:
+        cfg = _DEFAULT_CFG_FROZEN
+
+    updates = ctx.get("updates", [])
+    state.cycles += 1
+    ledger = state.ledger
+    changed = _apply_updates(ledger, updates, cfg)
 
     # Safe default when ledger is empty
     if ledger:
@@ -59,9 +86,9 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
     else:
         avg_trust = round(cfg["baseline_trust"], 3)
 
-    state.update({"ledger": ledger, "avg_trust": avg_trust})
+    state.avg_trust = avg_trust
 
-    risk_out = round(clamp(1.0 - avg_trust, 0.0, 1.0), 3)
+    risk_out = round(clamp01(1.0 - avg_trust), 3)
     action = "stabilize" if risk_out > 0.3 else "maintain"
     rationale = f"Avg trust={avg_trust:.2f}, risk={risk_out:.2f}. Updated {len(changed)} entries."
 
@@ -3,7 +3,13 @@
 # Refactored for v11r1: deterministic moral memory graph (no randomness, no persistence).
 
 from __future__ import annotations
+from types import MappingProxyType
 from typing import Dict, Any, Tuple, List
+from heapq import nlargest
+from itertools import islice
+from operator import itemgetter
+
+from core.module_helpers import audit_of, clamp, clamp01
 
 NAME = "Universe Graph & Memory"
 VERSION = "1.1.0"
@@ -11,11 +17,10 @@ VERSION = "1.1.0"
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+_STRENGTH = itemgetter(1)  # (label, strength) -> strength
 
 def safe_log(event: str, state: Dict[str, Any]) -> None:
-    state.setdefault("_audit", []).append({"event": event})
+    audit_of(state).append({"event": event})
 
 # ---------------------------------------------------------------------------
 # Config
@@ -26,6 +31,8 @@ DEFAULT_CFG = {
     "max_nodes": 500,               # memory size cap
     "max_links_per_node": 20,       # limit of contextual edges
 }
+# Read-only view handed out when ctx has no overrides (no per-call copy).
+_DEFAULT_CFG_FROZEN = MappingProxyType(DEFAULT_CFG)
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -50,23 +57,26 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
       - query: optional node label to retrieve its connected concepts
       - graph_cfg: overrides
     """
-    cfg = dict(DEFAULT_CFG)
-    cfg.update(ctx.get("graph_cfg", {}))
+    overrides = ctx.get("graph_cfg")
+    cfg = _DEFAULT_CFG_FROZEN if not overrides else {**DEFAULT_CFG, **overrides}
     obs: List[Tuple[str, str, float]] = ctx.get("observations", [])
     query = ctx.get("query")
 
     nodes = state.get("nodes", {})
     state["cycles"] = state.get("cycles", 0) + 1
 
-    # Passive decay on all links
+    # Passive decay on all links; each node's links are rebuilt in one pass,
+    # dropping those that fall below 0.001.
+    keep = 1.0 - cfg["link_decay"]
     for n in nodes.values():
-        n["valence"] *= (1.0 - cfg["link_decay"])
-        for k in list(n["links"].keys()):
-            n["links"][k] *= (1.0 - cfg["link_decay"])
-            if n["links"][k] < 0.001:
-                del n["links"][k]
+        n["valence"] *= keep
+        links = n["links"]
+        if links:
+            n["links"] = {k: w for k, s in links.items() if (w := s * keep) >= 0.001}
 
     # Add or reinforce links
+    gain = cfg["link_strength_gain"]
+    cap = cfg["max_links_per_node"]
     for src, tgt, valence in obs:
         if src not in nodes:
             nodes[src] = {"valence": 0.5, "links": {}}
@@ -78,28 +88,30 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Tuple[Dict[str, Any], Dic
         valence = clamp(float(valence), -1.0, 1.0)
 
         # Reinforce valence and link strength
-        src_n["valence"] = clamp(src_n["valence"] + valence * cfg["link_strength_gain"], -1.0, 1.0)
-        tgt_n["valence"] = clamp(tgt_n["valence"] + valence * cfg["link_strength_gain"], -1.0, 1.0)
+        src_n["valence"] = clamp(src_n["valence"] + valence * gain, -1.0, 1.0)
+        tgt_n["valence"] = clamp(tgt_n["valence"] + valence * gain, -1.0, 1.0)
 
-        src_n["links"][tgt] = clamp(src_n["links"].get(tgt, 0.0) + cfg["link_strength_gain"], 0.0, 1.0)
-        tgt_n["links"][src] = clamp(tgt_n["links"].get(src, 0.0) + cfg["link_strength_gain"], 0.0, 1.0)
+        src_links = src_n["links"]
+        tgt_links = tgt_n["links"]
+        src_links[tgt] = clamp01(src_links.get(tgt, 0.0) + gain)
+        tgt_links[src] = clamp01(tgt_links.get(src, 0.0) + gain)
 
-        # Cap link counts
-        if len(src_n["links"]) > cfg["max_links_per_node"]:
-            src_n["links"] = dict(sorted(src_n["links"].items(), key=lambda kv: -kv[1])[:cfg["max_links_per_node"]])
-        if len(tgt_n["links"]) > cfg["max_links_per_node"]:
-            tgt_n["links"] = dict(sorted(tgt_n["links"].items(), key=lambda kv: -kv[1])[:cfg["max_links_per_node"]])
+        # Cap link counts (keep the strongest; ties keep insertion order, as sorted() did)
+        if len(src_links) > cap:
+            src_n["links"] = dict(nlargest(cap, src_links.items(), key=_STRENGTH))
+        if len(tgt_links) > cap:
+            tgt_n["links"] = dict(nlargest(cap, tgt_links.items(), key=_STRENGTH))
 
     # Truncate oldest nodes if over capacity
-    if len(nodes) > cfg["max_nodes"]:
-        excess = len(nodes) - cfg["max_nodes"]
-        for k in list(nodes.keys())[:excess]:
+    excess = len(nodes) - cfg["max_nodes"]
+    if excess > 0:
+        for k in list(islice(nodes, excess)):
             del nodes[k]
 
     # Calculate system-level metrics
-    valences = [n["valence"] for n in nodes.values()]
-    avg_val = round(sum(valences) / max(len(valences), 1), 3)
-    total_links = sum(len(n["links"]) for n in nodes.values())
+    node_list = nodes.values()
+    avg_val = round(sum(n["valence"] for n in node_list) / max(len(nodes), 1), 3)
+    total_links = sum(len(n["links"]) for n in node_list)
     risk = round(1.0 - (avg_val + 1) / 2, 3)  # higher valence = lower risk
 
     state.update({"nodes": nodes, "avg_valence": avg_val, "total_links": total_links})
@@ -11,6 +11,7 @@ How it works:
       ctx.get("protection_index", float)
       ctx.get("urgency", "urgent"|"non-urgent")
       ctx.get("temporal", {...})  # may include user quiet/focus windows (optional)
+      ctx.get("_now", datetime)   # timezone-aware clock reading shared by the pipeline (optional)
   - Computes a deterministic decision: 'proceed' | 'batch' | 'proceed-override'
   - Returns a standard module dict with ok/action/risk/rationale/data
   - Also emits MIL-like flat keys under data['mil_temporal'] for downstream writers
@@ -27,17 +28,26 @@ def init():
     # Stateless; return a simple dict to align with your module pattern
     return {"cycles": 0}
 
-def _window_type(now: dt.datetime) -> str:
-    return "quiet" if (now.hour >= 22 or now.hour < 7) else "normal"
+def _is_quiet(hour: int) -> bool:
+    return hour >= 22 or hour < 7
 
-def _decide(pi: float, urgency: str, now: dt.datetime) -> str:
-    quiet = (now.hour >= 22 or now.hour < 7)
+def _window_type(quiet: bool) -> str:
+    return "quiet" if quiet else "normal"
+
+def _decide(pi: float, urgency: str, quiet: bool) -> str:
     if quiet and pi >= 0.80 and urgency.lower().startswith("urgent"):
         return "proceed-override"
     if quiet and pi <= 0.25 and urgency.lower().startswith("non"):
         return "batch"
     return "proceed"
 
+# Decision -> module action; built once rather than per call
+_ACTION_MAP = {
+    "proceed": "allow",
+    "batch": "defer",
+    "proceed-override": "allow"
+}
+
 def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
     state["cycles"] = state.get("cycles", 0) + 1
 
@@ -48,29 +58,31 @@ def run(ctx: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
     alts = str(ctx.get("temporal_alternatives", "defer-to-daytime; batch-safe"))
     legal = str(ctx.get("temporal_legal_basis", "Ethical Governance"))
 
-    now = dt.datetime.utcnow()
-    decision = _decide(pi, urgency, now)
+    now = ctx.get("_now")
+    now = now.astimezone(dt.timezone.utc) if now else dt.datetime.now(dt.timezone.utc)
+    hour = now.hour
+    quiet = _is_quiet(hour)
+    decision = _decide(pi, urgency, quiet)
+
+    # Date/clock text built once from the fields (same output as the strftime forms)
+    y, mo, d = now.year, now.month, now.day
+    clock = f"{hour:02d}:{now.minute:02d}:{now.second:02d}"
 
     mil_temporal = {
         "temporal.explain.why_now": why,
         "temporal.explain.alternatives": alts,
-        "temporal.human_time": now.strftime("%Y-%m-%d %H:%M:%S UTC"),
-        "temporal.universal_time": now.strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "temporal.window_type": _window_type(now),
+        "temporal.human_time": f"{y:04d}-{mo:02d}-{d:02d} {clock} UTC",
+        "temporal.universal_time": f"{y:04d}-{mo:02d}-{d:02d}T{clock}Z",
+        "temporal.window_type": _window_type(quiet),
         "temporal.legal_basis": legal,
-        "temporal.batch_id": f"TEMP-{now.strftime('%Y%m%d')}-{now.hour:02d}",
+        "temporal.batch_id": f"TEMP-{y:04d}{mo:02d}{d:02d}-{hour:02d}",
         "temporal.decision": decision,
         "temporal.pi": round(pi, 3),
         "temporal.urgency": urgency,
     }
 
     # Map to module action/risk (keep deterministic, conservative)
-    action_map = {
-        "proceed": "allow",
-        "batch": "defer",
-        "proceed-override": "allow"
-    }
-    action = action_map[decision]
+    action = _ACTION_MAP[decision]
     # Risk heuristic: higher when overriding quiet window, moderate when batching at night, minimal otherwise
     risk = 0.15 if decision == "proceed-override" else (0.10 if decision == "batch" else 0.05)
 
@@ -10,7 +10,8 @@ ArkEcho v13 — Temporal Governor (integration-safe, stand-alone)
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, time, timezone
-from typing import Any, Dict, Optional, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 
 # ------------------------------ Utilities ------------------------------
 
@@ -19,22 +20,27 @@ def _parse_hhmm(s: str) -> time:
     hh, mm = s.split(":")
     return time(hour=int(hh), minute=int(mm))
 
-def _now_local_iso() -> str:
-    try:
-        return datetime.now().astimezone().isoformat(timespec="seconds")
-    except Exception:
-        return datetime.now().isoformat(timespec="seconds")
+_URGENT_LEVELS = frozenset({"urgent", "critical", "high"})
+
+@lru_cache(maxsize=32)
+def _is_urgent(urgency: str) -> bool:
+    """Callers pass a handful of literals, so the normalisation is cached."""
+    return urgency.lower().strip() in _URGENT_LEVELS
 
 def _now_universal_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
+@lru_cache(maxsize=512)
+def _parse_window(window: str) -> Tuple[time, time]:
+    """Parse 'HH:MM-HH:MM' once; profiles repeat the same few window strings."""
+    start_s, end_s = window.split("-")
+    return _parse_hhmm(start_s), _parse_hhmm(end_s)
+
 def _in_window(now: time, window: str) -> bool:
     """
     window format: 'HH:MM-HH:MM'  (supports crossing midnight, e.g. 22:00-07:00).
     """
-    start_s, end_s = window.split("-")
-    start = _parse_hhmm(start_s)
-    end   = _parse_hhmm(end_s)
+    start, end = _parse_window(window)
     if start <= end:
         return start <= now <= end
     return now >= start or now <= end  # crosses midnight
@@ -51,7 +57,7 @@ def _first_match(now_local: time, windows: List[str]) -> Optional[str]:
 
 # ------------------------------ Data types ------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     user_id: str
     is_minor: bool
@@ -59,7 +65,7 @@ class UserProfile:
     quiet_windows: List[str]
     focus_windows: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     decision: str               # "proceed" | "batch" | "halt" | "proceed-override"
     reason: str
@@ -101,6 +107,7 @@ class TemporalGovernor:
         protection_index: float,
         urgency: str,
         reason: str = "",
+        now: Optional[datetime] = None,
     ) -> Decision:
         """
         Core deterministic decision tree:
@@ -109,6 +116,7 @@ class TemporalGovernor:
           3) Else if in quiet and urgent and allow_urgent_override -> PROCEED-OVERRIDE
           4) Else -> PROCEED
         Emits a flattened MIL temporal payload (dot-keys).
+        `now` (timezone-aware) lets a pipeline share one clock reading across modules.
         """
         # Normalize user
         u = UserProfile(
@@ -119,10 +127,12 @@ class TemporalGovernor:
             focus_windows=list(user_profile.get("focus_windows") or []),
         )
 
-        now_local_dt = datetime.now().astimezone()
+        # One clock reading for the window match and both timestamps
+        now_utc = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+        now_local_dt = now_utc.astimezone()
         now_local = now_local_dt.time()
-        now_local_iso = _now_local_iso()
-        now_universal_iso = _now_universal_iso()
+        now_local_iso = now_local_dt.isoformat(timespec="seconds")
+        now_universal_iso = now_utc.isoformat(timespec="seconds")
 
         in_quiet = _first_match(now_local, u.quiet_windows)
         in_focus = _first_match(now_local, u.focus_windows)
@@ -132,8 +142,7 @@ class TemporalGovernor:
         respect_quiet = bool(self.policy.get("respect_quiet_windows", True))
         allow_override = bool(self.policy.get("allow_urgent_override", True))
 
-        urgency_norm = str(urgency or "non-urgent").lower().strip()
-        is_urgent = urgency_norm in {"urgent", "critical", "high"}
+        is_urgent = _is_urgent(str(urgency or "non-urgent"))
 
         # --- Decision tree ---
         if u.is_minor and protection_index >= child_pi:
@@ -182,7 +191,8 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
       "user_profile": {...},          # dict
       "protection_index": 0.10,       # float
       "urgency": "non-urgent",        # str
-      "reason": "..."                 # str
+      "reason": "...",                # str
+      "_now": datetime                # optional, timezone-aware; shared pipeline clock
     }
     """
     policy = payload.get("policy") or {}
@@ -191,5 +201,5 @@ def run(payload: Dict[str, Any]) -> Dict[str, Any]:
     pi = float(payload.get("protection_index") or 0.0)
     urgency = str(payload.get("urgency") or "non-urgent")
     reason = str(payload.get("reason") or "")
-    dec = tg.decide(user, pi, urgency, reason)
+    dec = tg.decide(user, pi, urgency, reason, now=payload.get("_now"))
     return {"status": dec.status, "result": {"decision": dec.decision, "mil_temporal": dec.mil_temporal}}
@@ -9,15 +9,48 @@ Temporal/Guardian smoke probe for ArkEcho v13.
 """
 
 from __future__ import annotations
-import os, json, datetime as dt
+import os, datetime as dt
 from typing import Any, Dict, Tuple
 
 # --- helpers -----------------------------------------------------------------
 
+# Parsed policies by path, with the (mtime_ns, size) they were parsed at.
+_POLICY_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+# PyYAML is optional: imported on first policy parse, False once known missing.
+_yaml_mod: Any = None
+
+def _yaml():
+    global _yaml_mod
+    if _yaml_mod is None:
+        try:
+            import yaml
+            _yaml_mod = yaml
+        except Exception:
+            _yaml_mod = False
+    return _yaml_mod
+
 def _now_utc() -> dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
 
 def _read_cov_policy(path: str) -> Dict[str, Any]:
+    """
+    Cached front end for _parse_cov_policy: the file is only re-parsed when
+    its mtime or size changes. A missing file yields the defaults each time.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return _parse_cov_policy(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _POLICY_CACHE.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    policy = _parse_cov_policy(path)
+    _POLICY_CACHE[path] = (stamp, policy)
+    return policy
+
+def _parse_cov_policy(path: str) -> Dict[str, Any]:
     """
     Reads the very simple .cov file (YAML-lite) as if it were JSON-ish YAML.
     We avoid optional deps; implement a tiny tolerant parser:
@@ -32,18 +65,19 @@ def _read_cov_policy(path: str) -> Dict[str, Any]:
         }
 
     # Try YAML if available; otherwise parse our minimal subset
-    try:
-        import yaml
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
-        if not isinstance(data, dict):
-            data = {}
-        data.setdefault("legal_basis", "Ethical Governance")
-        data.setdefault("quiet_windows", [])
-        data.setdefault("focus_windows", [])
-        return data
-    except Exception:
-        pass
+    yaml = _yaml()
+    if yaml:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+            if not isinstance(data, dict):
+                data = {}
+            data.setdefault("legal_basis", "Ethical Governance")
+            data.setdefault("quiet_windows", [])
+            data.setdefault("focus_windows", [])
+            return data
+        except Exception:
+            pass
 
     # Fallback minimal parser (handles keys and list-of-maps in our example)
     legal_basis = "Ethical Governance"
@@ -112,6 +146,7 @@ def run(ctx: Dict[str, Any] | None, state: Dict[str, Any]) -> Dict[str, Any]:
         ctx["protection_index"] : float in [0,1]
         ctx["urgency"]          : "urgent" | "non-urgent"
         ctx["reason"]           : str rationale (optional)
+        ctx["_now"]             : timezone-aware datetime shared by the pipeline (optional)
     """
     state["cycles"] = int(state.get("cycles", 0)) + 1
     pi = float((ctx or {}).get("protection_index", 0.1))
@@ -124,7 +159,8 @@ def run(ctx: Dict[str, Any] | None, state: Dict[str, Any]) -> Dict[str, Any]:
     focus = policy.get("focus_windows", [])
     legal_basis = policy.get("legal_basis", "Ethical Governance")
 
-    now = _now_utc()
+    now = (ctx or {}).get("_now")
+    now = now.astimezone(dt.timezone.utc) if now else _now_utc()
     hour = now.hour
     in_quiet = _hour_in_any_windows(hour, quiet)
     in_focus = _hour_in_any_windows(hour, focus)
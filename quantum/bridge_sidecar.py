@@ -15,9 +15,9 @@ def run(ctx: dict, state=None) -> ModuleOutput:
     backend = cfg.get("backend", "classical")
     timeout = cfg.get("timeout", 1000)
     bridge = QuantumBridge(backend, timeout)
-    start = time.time()
+    start_ns = time.perf_counter_ns()  # monotonic; wall-clock steps cannot skew it
     # In a full implementation, tasks would be taken from ctx["quantum_batch"]
-    elapsed_ms = (time.time() - start) * 1000
+    elapsed_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
     return ModuleOutput(
         ok=True,
         action="allow",
@@ -61,6 +61,8 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from chain_of_custody_checks import calls_restricted_exec
+
 
 # ---------- utilities ----------
 
@@ -197,16 +199,16 @@ def _check_ops_safety_sandbox(ops_path: Path) -> Dict[str, Any]:
         return result
 
     try:
-        lines = ops_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        source = ops_path.read_text(encoding="utf-8", errors="replace")
     except Exception:
         return result
 
+    lines = source.splitlines()
     result["lines"] = lines
+    # detect compile(..., "<sandbox>", "exec") + exec() in code, not in comments/docstrings
+    result["restricted_exec_present"] = calls_restricted_exec(source)
 
     for line in lines:
-        # detect exec(compile(...,"<sandbox>","exec"))
-        if "exec(" in line and "compile(" in line and "<sandbox>" in line:
-            result["restricted_exec_present"] = True
         # detect attempts to block builtins
         # e.g. sandbox_globals = {"__builtins__": {}}
         if "__builtins__" in line and "={}" in line.replace(" ", ""):
@@ -55,6 +55,8 @@ from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from chain_of_custody_checks import calls_restricted_exec
+
 
 # ---------- project layout ----------
 
@@ -226,23 +228,17 @@ def _check_sandbox_file() -> Dict[str, Any]:
         return {**result, "passed": False}
 
     try:
-        lines = SANDBOX_PATH.read_text(encoding="utf-8", errors="replace").splitlines()
+        source = SANDBOX_PATH.read_text(encoding="utf-8", errors="replace")
     except Exception:
         return {**result, "passed": False}
 
-    for line in lines:
+    # look for compile(... "<sandbox>", "exec") + exec() in code, not in comments/docstrings
+    result["restricted_exec_present"] = calls_restricted_exec(source)
+
+    for line in source.splitlines():
         clean = line.strip()
         result["lines"].append(clean)
 
-        # look for exec(compile(... "<sandbox>", "exec"))
-        if (
-            "exec(" in clean
-            and "compile(" in clean
-            and "<sandbox>" in clean
-            and '"exec"' in clean
-        ):
-            result["restricted_exec_present"] = True
-
         # look for globals that kill builtins
         # e.g. sandbox_globals = {"__builtins__": {}}
         if "__builtins__" in clean and "{}" in clean: